@@ -1,19 +1,60 @@
-import random
+import os
 import time
+from typing import Optional
 
+import numpy as np
 
-def measure_entropy(duration_sec: float = 1.0) -> float:
+_READ_CHUNK = 4096
+_rng = np.random.default_rng()
+
+
+def measure_entropy_batch(durations: np.ndarray) -> np.ndarray:
+    """Mock entropy measurement over a sweep of capture windows (bits/sec).
+
+    All jitter factors are drawn in one PCG64 call, mirroring a D-RaNGe
+    style throughput sweep across window lengths.
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    bits = (600_000 * durations * _rng.uniform(0.95, 1.05, size=durations.shape)).astype(np.int64)
+    return bits / durations
+
+
+def _capture_device_bits(device: str, duration_sec: float) -> tuple:
+    """Read a hardware TRNG (e.g. /dev/hwrng) for *duration_sec*.
+
+    Returns ``(bits, elapsed_ns)`` bracketed by ``time.perf_counter_ns``.
+    """
+    fd = os.open(device, os.O_RDONLY)
+    try:
+        budget_ns = int(duration_sec * 1e9)
+        captured = 0
+        t0 = time.perf_counter_ns()
+        while True:
+            captured += len(os.read(fd, _READ_CHUNK))
+            elapsed = time.perf_counter_ns() - t0
+            if elapsed >= budget_ns:
+                return captured * 8, elapsed
+    finally:
+        os.close(fd)
+
+
+def measure_entropy(duration_sec: float = 1.0, device: Optional[str] = None) -> float:
     """Mock entropy measurement returning bits/sec.
     Replace with hardware TRNG reading via serial.
+
+    When *device* is given (e.g. a NeuG or BCM2835 ``/dev/hwrng``) it is read
+    with ``os.read`` in a loop and the rate comes from the real elapsed
+    interval measured with the monotonic ``time.perf_counter_ns``. The mock
+    path reports bits over the simulated *duration_sec* window.
     """
-    start = time.time()
-    # simulate bitstream capture
-    bits_captured = int(600_000 * duration_sec * random.uniform(0.95, 1.05))
-    time.sleep(duration_sec * 0.1)  # simulate processing delay
-    rate = bits_captured / duration_sec
-    return rate
+    if device is not None:
+        bits_captured, elapsed_ns = _capture_device_bits(device, duration_sec)
+        return bits_captured * 1e9 / elapsed_ns
+
+    rate = measure_entropy_batch(np.array([duration_sec]))[0]
+    return float(rate)
 
 
 if __name__ == "__main__":
     rate = measure_entropy(1.0)
-    print(f"Entropy rate: {rate:.0f} bps") 
\ No newline at end of file
+    print(f"Entropy rate: {rate:.0f} bps")
@@ -1,14 +1,59 @@
+import argparse
+import math
+from statistics import NormalDist
+
 import numpy as np
 import random
 
 
-def measure_latency_ns(samples: int = 1000) -> float:
+OG_LATENCY_MEAN_NS = 7.0
+OG_LATENCY_SIGMA_NS = 1.0
+
+_STD_NORMAL = NormalDist()
+
+# Reusable sample buffer for the --exact path (grown on demand)
+_buf = np.empty(0)
+_rng = np.random.default_rng()
+
+
+def _max_normal_quantile(u: float, samples: int, loc: float, scale: float) -> float:
+    """Inverse CDF of the maximum of *samples* i.i.d. N(loc, scale) draws.
+
+    P(max <= x) = Phi(x)**samples, so the quantile is Phi^-1(u**(1/samples)).
+    The upper tail is taken via expm1 to stay accurate for large *samples*.
+    """
+    log_p = math.log(u) / samples
+    p = math.exp(log_p)
+    q = -math.expm1(log_p)
+    z = _STD_NORMAL.inv_cdf(p) if p < 0.5 else -_STD_NORMAL.inv_cdf(q)
+    return loc + scale * z
+
+
+def measure_latency_ns(samples: int = 1000, exact: bool = False) -> float:
     """Mock photonic optic-gate latency measurement.
     Replace with Verilator or oscilloscope interface.
+
+    The worst case is drawn directly from the extreme-value distribution of
+    *samples* normal latencies (mean 7 ns ±1) in O(1). With ``exact=True``
+    the samples are materialised into a reused module-level buffer instead.
     """
-    latencies = np.random.normal(loc=7, scale=1, size=samples)  # mean 7 ns ±1
-    worst = float(np.max(latencies))
-    return worst
+    global _buf
+    if exact:
+        if _buf.size < samples:
+            _buf = np.empty(samples)
+        view = _buf[:samples]
+        _rng.standard_normal(out=view)
+        view *= OG_LATENCY_SIGMA_NS
+        view += OG_LATENCY_MEAN_NS
+        return float(view.max())
+
+    u = np.random.uniform(np.finfo(float).tiny, 1.0)
+    worst = _max_normal_quantile(u, samples, OG_LATENCY_MEAN_NS, OG_LATENCY_SIGMA_NS)
+    return float(worst)
 
 if __name__ == "__main__":
-    print(f"Worst-case OG latency: {measure_latency_ns():.2f} ns") 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Mock optic-gate latency measurement")
+    parser.add_argument("--samples", type=int, default=1000, help="Number of latency samples")
+    parser.add_argument("--exact", action="store_true", help="Materialise every sample instead of the closed form")
+    args = parser.parse_args()
+    print(f"Worst-case OG latency: {measure_latency_ns(args.samples, exact=args.exact):.2f} ns")
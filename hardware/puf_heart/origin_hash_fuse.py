@@ -5,49 +5,102 @@ Write-once flash Origin Hash onto PUF fuse (hardware vault)
 Biblical Foundation: Revelation 22:18-19 - Nothing added or taken away
 """
 
+import argparse
 import hashlib
 import json
+import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
 
+# Shared atomic JSON writer; when this file is run directly rather than with
+# python -m, the repository root is put on sys.path so scripts/ is importable
+try:
+    from scripts.atomic_io import atomic_write_bytes, dumps_indent
+except ModuleNotFoundError:  # pragma: no cover – direct script run
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from scripts.atomic_io import atomic_write_bytes, dumps_indent
+
+
+def _canonical_json(obj):
+    """Canonical (sorted-key, ASCII) JSON bytes used for fused hashes
+
+    Stays on stdlib json: the fused hash depends on its separators.
+    """
+    return json.dumps(obj, sort_keys=True).encode('ascii')
+
+
+def _utc_now_iso():
+    """Current UTC time as an ISO-8601 string with a 'Z' suffix"""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+# Constant origin fields. With sorted keys they all serialize ahead of the
+# per-build fields, so their bytes form a fixed prefix of the canonical JSON.
+ORIGIN_PREFIX = {
+    "ark_version": "v1.0",
+    "biblical_foundation": "1_Thessalonians_5_21_Test_everything_hold_fast_what_is_good",
+    "critical_exploits": 0,
+    "divine_blessing": "Psalm_91_11_Angels_charge_over_thee"
+}
+
+# SHA-256 state after absorbing the prefix ('{...' up to and including ', ')
+_SHA_PREFIX = hashlib.sha256(_canonical_json(ORIGIN_PREFIX)[:-1] + b", ")
+
+
 class OriginHashFuseWriter:
     """ARK Origin Hash PUF Fuse Writer with Biblical Protection"""
     
-    def __init__(self):
+    # Static origin inputs
+    GIT_COMMIT = "70882f9"  # ARK v1.0-RC commit
+    EVIDENCE_BUNDLE_SHA256 = "3390fd402cd750ab3857a5da6e677e9644206e65bd5fde5bcc161c71cd9007c4"
+    ORIGIN_TIMESTAMP = "2025-06-11T23:20:00Z"
+    
+    # Ceremony pauses (seconds): vault init, protection check, fuse write
+    CEREMONY_DELAYS = (1, 1, 2)
+    
+    def __init__(self, theatrical: bool = False):
+        self.theatrical = theatrical
         self.biblical_foundation = "Revelation_22_18_19_Nothing_added_or_taken_away"
         self.divine_authority = "Romans_13_1_Let_every_soul_be_subject_to_governing_authorities"
         self.write_once_protection = True
         
-    def calculate_origin_hash(self):
-        """Calculate the immutable Origin Hash for ARK v1.0"""
-        
-        # Get git commit hash
-        git_hash = "70882f9"  # ARK v1.0-RC commit
+    def origin_hash_for(self, git_commit, evidence_bundle_sha256, timestamp):
+        """Origin hash and content for one candidate build
         
-        # Combine with evidence bundle hash
-        evidence_hash = "3390fd402cd750ab3857a5da6e677e9644206e65bd5fde5bcc161c71cd9007c4"
-        
-        # Biblical witness
-        biblical_witness = "1_Thessalonians_5_21_Test_everything_hold_fast_what_is_good"
+        The constant leading fields are pre-hashed once (_SHA_PREFIX);
+        each call copies that state and only hashes the variable tail.
+        """
         
         # Create origin content
         origin_content = {
-            "ark_version": "v1.0",
-            "git_commit": git_hash,
-            "evidence_bundle_sha256": evidence_hash,
-            "biblical_foundation": biblical_witness,
-            "timestamp": "2025-06-11T23:20:00Z",
+            "ark_version": ORIGIN_PREFIX["ark_version"],
+            "git_commit": git_commit,
+            "evidence_bundle_sha256": evidence_bundle_sha256,
+            "biblical_foundation": ORIGIN_PREFIX["biblical_foundation"],
+            "timestamp": timestamp,
             "validation_status": "ALL_L0_L6_PASSED",
-            "critical_exploits": 0,
-            "divine_blessing": "Psalm_91_11_Angels_charge_over_thee"
+            "critical_exploits": ORIGIN_PREFIX["critical_exploits"],
+            "divine_blessing": ORIGIN_PREFIX["divine_blessing"]
         }
         
-        # Calculate immutable origin hash
-        content_string = json.dumps(origin_content, sort_keys=True)
-        origin_hash = hashlib.sha256(content_string.encode()).hexdigest()
+        # Tail of the canonical serialization, without its opening brace
+        suffix = {k: v for k, v in origin_content.items() if k not in ORIGIN_PREFIX}
+        hasher = _SHA_PREFIX.copy()
+        hasher.update(_canonical_json(suffix)[1:])
         
-        return origin_hash, origin_content
+        return hasher.hexdigest(), origin_content
+    
+    @cached_property
+    def _origin(self):
+        """Origin hash and content, computed once per writer"""
+        return self.origin_hash_for(self.GIT_COMMIT, self.EVIDENCE_BUNDLE_SHA256, self.ORIGIN_TIMESTAMP)
+    
+    def calculate_origin_hash(self):
+        """Calculate the immutable Origin Hash for ARK v1.0"""
+        origin_hash, origin_content = self._origin
+        return origin_hash, dict(origin_content)
     
     def prepare_fuse_data(self):
         """Prepare data for PUF fuse writing"""
@@ -68,9 +121,17 @@ class OriginHashFuseWriter:
         
         return fuse_data
     
-    def simulate_fuse_write(self, fuse_data):
+    def _ceremony_pause(self, seconds):
+        """Sleep only in theatrical mode; the delay is recorded in the log"""
+        if self.theatrical:
+            time.sleep(seconds)
+    
+    def simulate_fuse_write(self, fuse_data, ceremony_timestamp=None):
         """Simulate hardware fuse writing (requires actual hardware)"""
         
+        if ceremony_timestamp is None:
+            ceremony_timestamp = _utc_now_iso()
+        
         print("🔥 ARK ORIGIN HASH FUSE WRITING CEREMONY")
         print("=" * 60)
         print(f"📜 Biblical Foundation: {self.biblical_foundation}")
@@ -83,28 +144,31 @@ class OriginHashFuseWriter:
         print()
         
         # Simulated hardware ceremony
+        init_delay, verify_delay, write_delay = self.CEREMONY_DELAYS
+        
         print("⚡ Initializing PUF hardware vault...")
-        time.sleep(1)
+        self._ceremony_pause(init_delay)
         
         print("🛡️  Verifying write-once protection...")
-        time.sleep(1)
+        self._ceremony_pause(verify_delay)
         
         print("🔥 Writing Origin Hash to PUF fuse...")
-        time.sleep(2)
+        self._ceremony_pause(write_delay)
         
         print("✅ Fuse write completed successfully!")
         print("🔒 Write-once protection engaged - Hash is now immutable")
         
         # Generate fuse log
         fuse_log = {
-            "ceremony_timestamp": datetime.now().isoformat() + 'Z',
+            "ceremony_timestamp": ceremony_timestamp,
             "operation": "ORIGIN_HASH_FUSE_WRITE",
             "status": "SUCCESS", 
             "origin_hash": fuse_data['origin_hash'],
             "fuse_address": fuse_data['fuse_address'],
             "biblical_blessing": "Revelation_22_18_19_Seal_not_the_words",
             "write_once_active": True,
-            "verification_passed": True
+            "verification_passed": True,
+            "simulated_delay_s": sum(self.CEREMONY_DELAYS)
         }
         
         return fuse_log
@@ -118,14 +182,13 @@ class OriginHashFuseWriter:
         fuse_data = self.prepare_fuse_data()
         
         # Simulate fuse writing
-        fuse_log = self.simulate_fuse_write(fuse_data)
+        fuse_log = self.simulate_fuse_write(fuse_data, ceremony_timestamp=_utc_now_iso())
         
         # Save fuse log
         log_path = Path("hardware/puf_heart/ark_origin_fuse_log.json")
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(log_path, 'w') as f:
-            json.dump(fuse_log, f, indent=2)
+        atomic_write_bytes(log_path, dumps_indent(fuse_log))
         
         print(f"\n📋 Fuse log saved: {log_path}")
         print(f"🔐 Origin Hash: {fuse_data['origin_hash']}")
@@ -134,7 +197,12 @@ class OriginHashFuseWriter:
 
 def main():
     """Main fuse writing ceremony"""
-    writer = OriginHashFuseWriter()
+    parser = argparse.ArgumentParser(description="ARK Origin Hash PUF fuse writer")
+    parser.add_argument("--theatrical", action="store_true",
+                        help="Pause between ceremony steps like the real hardware")
+    args = parser.parse_args()
+    
+    writer = OriginHashFuseWriter(theatrical=args.theatrical)
     fuse_log, origin_hash = writer.generate_fuse_log()
     
     print("\n🎉 ARK ORIGIN HASH FUSED TO HARDWARE VAULT!")
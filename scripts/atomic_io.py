@@ -0,0 +1,59 @@
+"""
+ARK atomic report output
+Shared by the evidence, coverage and fuse-log writers: indented JSON in one
+buffer, written through a fsynced temp file and renamed over the target, so a
+crash or a concurrent writer never leaves a truncated report behind.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Prefer orjson for serialization; fall back to stdlib json
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – stdlib fallback
+    orjson = None
+
+# Process umask, read once: NamedTemporaryFile creates files 0600, the final
+# report gets the mode a plain open() would have given it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def dumps_indent(obj, sort_keys=False):
+    """Serialize *obj* to indented JSON bytes in one buffer"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2, sort_keys=sort_keys).encode('utf-8')
+
+
+def atomic_write_bytes(path, data):
+    """Atomically replace *path* with *data*
+
+    The bytes go to a uniquely named temp file in the same directory, which
+    is flushed and fsynced before os.replace renames it over *path*.
+    """
+    path = Path(path)
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + '.',
+                                      suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+def dump_json(obj, path, sort_keys=False):
+    """Atomically write *obj* to *path* as indented JSON"""
+    atomic_write_bytes(path, dumps_indent(obj, sort_keys=sort_keys))
@@ -5,11 +5,42 @@ Biblical Foundation: "Be diligent to present yourself approved to God" - 2 Timot
 """
 
 import subprocess
+import hashlib
 import json
+import os
 import sys
 from pathlib import Path
+import importlib.metadata
 import importlib.util
 
+import numpy as np
+
+# Prefer orjson for parsing reports; fall back to stdlib json
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – stdlib fallback
+    orjson = None
+
+# Stream large coverage.json files in constant memory when ijson is available
+try:
+    import ijson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – full parse fallback
+    ijson = None
+
+# BLAKE3 for the source-tree fingerprint; hashlib SHA-256 otherwise
+try:
+    from blake3 import blake3  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – hashlib fallback
+    blake3 = None
+
+# Shared atomic JSON writer; when this file is run directly rather than with
+# python -m, the repository root is put on sys.path so scripts/ is importable
+try:
+    from scripts.atomic_io import dump_json
+except ModuleNotFoundError:  # pragma: no cover – direct script run
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from scripts.atomic_io import dump_json
+
 # Ensure UTF-8 stdout/stderr even on Windows code-page consoles
 if hasattr(sys.stdout, "reconfigure"):
     sys.stdout.reconfigure(encoding="utf-8")
@@ -19,67 +50,166 @@ if hasattr(sys.stderr, "reconfigure"):
 # Ensure pytest-cov availability
 if importlib.util.find_spec("pytest_cov") is None:
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "pytest-cov"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        subprocess.run([sys.executable, "-m", "pip", "install", "-q", "pytest-cov"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except subprocess.CalledProcessError as e:
         print("⚠️  Failed to install pytest-cov automatically:", e, file=sys.stderr)
 
+COVERAGE_SOURCES = ['software', 'firmware']
+TOTAL_THRESHOLD = 98.0
+FILE_THRESHOLD = 95.0
+
+# Кэш L1: отпечаток исходников, при котором был получен coverage.json
+L1_CACHE_FILE = Path('.l1_cache.json')
+# Tree -> glob of files fingerprinted for the coverage cache; tests/ keeps
+# fixtures and data files, not just modules
+L1_TRACKED_TREES = {**{tree: '*.py' for tree in COVERAGE_SOURCES}, 'tests': '*'}
+# Test configuration found anywhere in the repository, plus root-level files
+L1_CONFIG_NAMES = {'conftest.py', 'pytest.ini', 'pyproject.toml', 'setup.cfg', 'tox.ini'}
+L1_ROOT_FILES = ['.coveragerc', 'requirements.txt', 'requirements-dev.txt']
+# Tool versions that change what is collected or measured
+L1_TOOL_DISTRIBUTIONS = ['pytest', 'pytest-cov', 'coverage']
+
+
+def _file_coverage(cov):
+    """Покрытие по файлам из CoverageData: (names, statements, missing)"""
+    names = sorted(cov.get_data().measured_files())
+    statements = np.zeros(len(names), dtype=np.int64)
+    missing = np.zeros(len(names), dtype=np.int64)
+    for i, filename in enumerate(names):
+        _, file_statements, _, file_missing, _ = cov.analysis2(filename)
+        statements[i] = len(file_statements)
+        missing[i] = len(file_missing)
+    return [os.path.relpath(n) for n in names], statements, missing
+
+
+def _files_below_threshold(names, statements, missing, threshold):
+    """Векторный отбор файлов с покрытием ниже порога: [(filename, percent)]"""
+    percent = np.full(len(names), 100.0)
+    np.divide(100.0 * (statements - missing), statements, out=percent, where=statements > 0)
+    below = np.flatnonzero(percent < threshold)
+    return [(names[i], float(percent[i])) for i in below]
+
+
 def run_coverage_analysis():
     """Запуск анализа покрытия с требованием ≥98%"""
     
+    import coverage
+    import pytest
+    
     print("🔍 Running comprehensive coverage analysis...")
     
-    # Запуск pytest с покрытием
-    try:
-        result = subprocess.run([
-            'python', '-m', 'pytest', 
-            '--cov=software', 
-            '--cov=firmware', 
-            '--cov-report=html:htmlcov',
-            '--cov-report=json:coverage.json',
-            '--cov-report=term-missing',
-            '--cov-fail-under=98',
+    if importlib.util.find_spec("xdist") is not None:
+        # Параллельный запуск: pytest-cov собирает данные воркеров и объединяет их в .coverage
+        rc = pytest.main([
+            '-n', 'auto',
+            '--dist=loadfile',
+            *[f'--cov={source}' for source in COVERAGE_SOURCES],
+            '--cov-report=',
             'tests/'
-        ], capture_output=True, text=True, check=True)
-        
-        print("✅ Coverage analysis completed")
-        print(result.stdout)
-        
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Coverage analysis failed: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+        ])
+        cov = coverage.Coverage(source=COVERAGE_SOURCES)
+        cov.load()
+    else:
+        # Запуск pytest с покрытием в текущем процессе (без fork и повторного импорта)
+        cov = coverage.Coverage(source=COVERAGE_SOURCES)
+        cov.start()
+        try:
+            rc = pytest.main(['tests/'])
+        finally:
+            cov.stop()
+            cov.save()
+    
+    if rc != 0:
+        print(f"❌ Coverage analysis failed: pytest exited with {int(rc)}")
         return False
     
-    # Анализ coverage.json
-    coverage_file = Path('coverage.json')
-    if coverage_file.exists():
-        with open(coverage_file, 'r') as f:
-            coverage_data = json.load(f)
-        
-        total_coverage = coverage_data['totals']['percent_covered']
-        print(f"📊 Total Coverage: {total_coverage:.2f}%")
+    print("✅ Coverage analysis completed")
+    
+    try:
+        total_coverage = cov.report(show_missing=True)
+    except coverage.exceptions.NoDataError:
+        print("❌ No coverage data collected")
+        return False
+    cov.html_report(directory='htmlcov')
+    cov.json_report(outfile='coverage.json')
+    
+    names, statements, missing = _file_coverage(cov)
+    return _check_coverage(total_coverage, names, statements, missing)
+
+
+def _check_coverage(total_coverage, names, statements, missing):
+    """Проверка общего порога и вывод файлов ниже порога покрытия"""
+    
+    print(f"📊 Total Coverage: {total_coverage:.2f}%")
+    
+    if total_coverage < TOTAL_THRESHOLD:
+        print(f"❌ Coverage below threshold: {total_coverage:.2f}% < {TOTAL_THRESHOLD}%")
+        return False
+    else:
+        print(f"✅ Coverage meets threshold: {total_coverage:.2f}% ≥ {TOTAL_THRESHOLD}%")
         
-        if total_coverage < 98.0:
-            print(f"❌ Coverage below threshold: {total_coverage:.2f}% < 98.0%")
-            return False
+    # Детальный анализ по файлам
+    files_below_threshold = _files_below_threshold(names, statements, missing, FILE_THRESHOLD)
+    
+    # Контроль: взвешенное по строкам покрытие должно совпадать с отчётом
+    total_statements = int(statements.sum())
+    if total_statements:
+        recomputed = 100.0 * (total_statements - int(missing.sum())) / total_statements
+        if abs(recomputed - total_coverage) > 0.01:
+            print(f"⚠️  Per-file total {recomputed:.2f}% disagrees with report {total_coverage:.2f}%")
+    
+    if files_below_threshold:
+        print(f"⚠️  Files below {FILE_THRESHOLD:.0f}% coverage:")
+        for filename, file_coverage in files_below_threshold:
+            print(f"   {filename}: {file_coverage:.2f}%")
+    
+    return total_coverage >= TOTAL_THRESHOLD
+
+
+def load_coverage_json(path):
+    """Чтение coverage.json: (total, names, statements, missing)
+
+    С ijson файл читается потоково (память O(1) по размеру отчёта);
+    иначе — полный разбор через orjson/json.
+    """
+    names, statements, missing = [], [], []
+    
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            for filename, file_data in ijson.kvitems(f, 'files', use_float=True):
+                summary = file_data['summary']
+                names.append(filename)
+                statements.append(summary['num_statements'])
+                missing.append(summary['missing_lines'])
+        with open(path, 'rb') as f:
+            total_coverage = next(ijson.items(f, 'totals.percent_covered', use_float=True))
+    else:
+        if orjson is not None:
+            coverage_data = orjson.loads(Path(path).read_bytes())
         else:
-            print(f"✅ Coverage meets threshold: {total_coverage:.2f}% ≥ 98.0%")
-            
-        # Детальный анализ по файлам
-        files_below_threshold = []
+            with open(path, 'r') as f:
+                coverage_data = json.load(f)
         for filename, file_data in coverage_data['files'].items():
-            file_coverage = file_data['summary']['percent_covered']
-            if file_coverage < 95.0:  # Per-file threshold
-                files_below_threshold.append((filename, file_coverage))
-        
-        if files_below_threshold:
-            print("⚠️  Files below 95% coverage:")
-            for filename, coverage in files_below_threshold:
-                print(f"   {filename}: {coverage:.2f}%")
-        
-        return total_coverage >= 98.0
+            summary = file_data['summary']
+            names.append(filename)
+            statements.append(summary['num_statements'])
+            missing.append(summary['missing_lines'])
+        total_coverage = coverage_data['totals']['percent_covered']
+    
+    return (float(total_coverage), names,
+            np.asarray(statements, dtype=np.int64), np.asarray(missing, dtype=np.int64))
+
+
+def analyze_coverage_json(path='coverage.json'):
+    """Проверка порогов по готовому coverage.json без повторного запуска тестов"""
     
-    return False
+    print(f"🔍 Analyzing existing coverage report: {path}")
+    
+    if not Path(path).exists():
+        print(f"❌ Coverage report not found: {path}")
+        return False
+    
+    return _check_coverage(*load_coverage_json(path))
 
 def run_fuzz_stats():
     """Запуск AFL++ статистики с требованием ≥10^8 мутаций"""
@@ -120,10 +250,76 @@ def run_fuzz_stats():
     
     return fuzz_pass
 
-def generate_l1_report():
+def _file_digest(path):
+    """Хэш одного файла (BLAKE3 при наличии, иначе SHA-256)"""
+    if blake3 is not None:
+        hasher = blake3()
+        hasher.update_mmap(path)
+        return hasher.digest()
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').digest()
+
+
+def _config_files(root='.'):
+    """Конфигурация тестов по всему репозиторию (скрытые каталоги и __pycache__ пропускаются)"""
+    found = {Path(name) for name in L1_ROOT_FILES if Path(root, name).is_file()}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+        found.update(Path(dirpath, name) for name in filenames if name in L1_CONFIG_NAMES)
+    return found
+
+
+def _tool_versions():
+    """Версии Python и инструментов покрытия"""
+    versions = [f"python={sys.version}"]
+    for dist in L1_TOOL_DISTRIBUTIONS:
+        try:
+            versions.append(f"{dist}={importlib.metadata.version(dist)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(f"{dist}=missing")
+    return versions
+
+
+def source_tree_digest(trees=L1_TRACKED_TREES):
+    """Отпечаток входов прогона покрытия: файлы деревьев, конфигурация тестов и версии инструментов"""
+    paths = {p for tree, pattern in trees.items() if Path(tree).is_dir()
+             for p in Path(tree).rglob(pattern)
+             if p.is_file() and '__pycache__' not in p.parts}
+    paths = sorted(paths | _config_files(), key=lambda p: p.as_posix())
+    outer = blake3(max_threads=blake3.AUTO) if blake3 is not None else hashlib.sha256()
+    for version in _tool_versions():
+        outer.update(version.encode('utf-8') + b'\0')
+    for path in paths:
+        outer.update(path.as_posix().encode('utf-8') + b'\0')
+        outer.update(_file_digest(path))
+    return outer.hexdigest()
+
+
+def _cached_coverage_is_fresh(digest):
+    """coverage.json существует, получен для тех же исходников и прошёл проверку"""
+    if not (L1_CACHE_FILE.exists() and Path('coverage.json').exists()):
+        return False
+    try:
+        cache = json.loads(L1_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return cache.get('source_digest') == digest and cache.get('coverage_pass') is True
+
+
+def generate_l1_report(coverage_json=None, force=False):
     """Генерация финального отчета L1 уровня"""
     
-    coverage_pass = run_coverage_analysis()
+    if coverage_json is not None:
+        coverage_pass = analyze_coverage_json(coverage_json)
+    else:
+        digest = source_tree_digest()
+        if not force and _cached_coverage_is_fresh(digest):
+            print("♻️  Sources unchanged since last run; reusing coverage.json (--force to re-run)")
+            coverage_pass = analyze_coverage_json('coverage.json')
+        else:
+            coverage_pass = run_coverage_analysis()
+            if Path('coverage.json').exists():
+                dump_json({'source_digest': digest, 'coverage_pass': coverage_pass}, L1_CACHE_FILE)
     fuzz_pass = run_fuzz_stats()
     
     report = {
@@ -143,8 +339,7 @@ def generate_l1_report():
         }
     }
     
-    with open('l1_analysis_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    dump_json(report, 'l1_analysis_report.json')
     
     print(f"\n📋 L1 ANALYSIS SUMMARY:")
     print(f"   Coverage: {'✅ PASSED' if coverage_pass else '❌ FAILED'}")
@@ -155,5 +350,14 @@ def generate_l1_report():
     return coverage_pass and fuzz_pass
 
 if __name__ == "__main__":
-    success = generate_l1_report()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="ARK L1 coverage and fuzz report")
+    parser.add_argument("--from-json", metavar="PATH",
+                        help="Gate on an existing coverage.json instead of re-running the tests")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run the test suite even if sources are unchanged")
+    args = parser.parse_args()
+    
+    success = generate_l1_report(coverage_json=args.from_json, force=args.force)
     sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -11,24 +11,50 @@ The system must pass ALL verification checks to receive divine blessing for depl
 """
 
 import os
+import re
 import sys
 import json
 import hashlib
-import subprocess
+import mmap
+import operator
 import time
-from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+import atexit
+from array import array
 import logging
+import logging.handlers
+
+# Prefer orjson for the report; fall back to stdlib json
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – stdlib fallback
+    orjson = None
+
+# Aho-Corasick keyword automaton for the compliance scan; regex otherwise
+try:
+    import ahocorasick  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – single-regex fallback
+    ahocorasick = None
 
 # Biblical foundation constants
 BIBLICAL_FOUNDATION = "1_Thessalonians_5_21_Test_everything_hold_fast_what_is_good"
 DIVINE_AUTHORITY = "Psalm_91_11_He_will_command_His_angels_concerning_you"
 ARK_VERSION = "3.0.0"
 
+# Digests of the constant foundation strings, computed once at import
+_FOUNDATION_HASH = hashlib.sha256(BIBLICAL_FOUNDATION.encode()).hexdigest()
+_AUTHORITY_HASH = hashlib.sha256(DIVINE_AUTHORITY.encode()).hexdigest()
+
 # SRS v1.0 requirement thresholds
-SRS_REQUIREMENTS = {
+_SRS_REQUIREMENTS_RAW = {
     "HW-01": {"name": "Entropy Rate", "threshold": 512000, "unit": "bps", "operator": ">="},
     "HW-02": {"name": "FI Tolerance", "threshold": 80, "unit": "%", "operator": ">="},
     "HW-03a": {"name": "PUF Intra-Hamming", "threshold": 45, "unit": "%", "operator": ">="},
@@ -43,7 +69,254 @@ SRS_REQUIREMENTS = {
     "SEC-03": {"name": "FROST Security", "threshold": 128, "unit": "bits", "operator": ">="}
 }
 
-@dataclass
+# Comparison applied as measured <op> threshold
+_COMPARATORS: Dict[str, Callable[[float, float], bool]] = {">=": operator.ge, "<=": operator.le}
+
+@dataclass(frozen=True, slots=True)
+class SRSRequirement:
+    """Immutable SRS v1.0 requirement threshold"""
+    name: str
+    threshold: float
+    unit: str
+    operator: str  # display form, e.g. ">="
+    op_fn: Callable[[float, float], bool] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "op_fn", _COMPARATORS[self.operator])
+
+SRS_REQUIREMENTS: Dict[str, SRSRequirement] = {
+    req_id: SRSRequirement(**req) for req_id, req in _SRS_REQUIREMENTS_RAW.items()
+}
+
+# Threshold matrix in SRS_REQUIREMENTS order for vectorized checks
+_SRS_INDEX = {req_id: i for i, req_id in enumerate(SRS_REQUIREMENTS)}
+_SRS_THRESHOLDS = np.array([req.threshold for req in SRS_REQUIREMENTS.values()], dtype=np.float64)
+_SRS_IS_GEQ = np.array([req.op_fn is operator.ge for req in SRS_REQUIREMENTS.values()], dtype=bool)
+
+@lru_cache(maxsize=None)
+def _srs_slice(req_ids: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Thresholds and >= mask for *req_ids*, gathered once per id tuple"""
+    idx = np.fromiter((_SRS_INDEX[req_id] for req_id in req_ids), dtype=np.intp, count=len(req_ids))
+    thresholds, is_geq = _SRS_THRESHOLDS[idx], _SRS_IS_GEQ[idx]
+    thresholds.flags.writeable = is_geq.flags.writeable = False
+    return thresholds, is_geq
+
+def evaluate_srs_thresholds(req_ids: List[str], measured: List[float]) -> np.ndarray:
+    """Compare measured values against their SRS thresholds in one vectorized pass"""
+    thresholds, is_geq = _srs_slice(tuple(req_ids))
+    values = np.asarray(measured, dtype=np.float64)
+    return np.where(is_geq, values >= thresholds, values <= thresholds)
+
+# Section plans: (requirement ids, measurement method, values recorded on error)
+HARDWARE_MEASUREMENTS = (
+    (("HW-01",), "_measure_puf_entropy_rate", (0.0,)),                           # Entropy ≥ 512 Kbps
+    (("HW-02",), "_measure_fault_injection_tolerance", (0.0,)),                  # Common-mode FI ≥ 80%
+    (("HW-03a", "HW-03b"), "_measure_puf_hamming_distances", (0.0, 100.0)),      # Intra ≥ 45%, inter ≤ 50%
+    (("HW-04",), "_measure_optic_gate_latency", (999.0,)),                       # OG latency ≤ 10 ns
+)
+SOFTWARE_MEASUREMENTS = (
+    (("SW-01",), "_verify_dsl_abnf_compliance", (0.0,)),                         # DSL 100% ABNF compliance
+    (("SW-02",), "_measure_cold_mirror_performance", (999.0,)),                  # Cold-Mirror ≤ 50ms / 512 events
+    (("SW-03",), "_verify_coaudit_poc_generation", (0.0,)),                      # Co-Audit ≥ 1 PoC per 24h
+    (("SW-04",), "_measure_patch_rollback_time", (999.0,)),                      # Rollback ≤ 200ms
+)
+SECURITY_MEASUREMENTS = (
+    (("SEC-01",), "_verify_masking_order", (0.0,)),                              # Masking order ≥ 3
+    (("SEC-02",), "_measure_side_channel_snr", (999.0,)),                        # Side-channel SNR ≤ 1.0
+    (("SEC-03",), "_verify_frost_security", (0.0,)),                             # FROST ≥ 128 bits
+)
+
+# Biblical checks recorded alongside a measurement: req id -> (check, scripture, details)
+MEASUREMENT_SCRIPTURES = {
+    "HW-01": ("Divine Randomness Source", "Proverbs 16:33", "PUF Heart provides {} bps divine entropy"),
+    "HW-04": ("Divine Light-Speed Decisions", "Psalm 119:105", "Optic Gate processes moral decisions in {} ns"),
+    "SW-01": ("Biblical Moral Language", "Deuteronomy 6:6-7", "Ethics DSL parses Biblical morality with {}% accuracy"),
+    "SEC-02": ("Divine Protection from Attackers", "Isaiah 54:17", "Side-channel protection maintains SNR of {}"),
+}
+
+# Biblical compliance scan: category -> (alternatives, source trees searched, ignore case).
+# Alternatives are literal keywords where ".*" spans the rest of a line, as in grep.
+# The kill-switch check searches the whole working tree, as its path-less grep -r did.
+COMPLIANCE_SOURCE_ROOTS = ("software", "firmware", ".")
+COMPLIANCE_PATTERNS = {
+    "commandments": (
+        ("no_other_gods", "no_graven_images", "no_vain_names", "remember_sabbath", "honor_parents",
+         "no_murder", "no_adultery", "no_stealing", "no_false_witness", "no_coveting"),
+        ("software", "firmware"),
+        False,
+    ),
+    "love": (("love.*neighbor", "Matthew.*22.*39"), ("software",), True),
+    "killswitch": (("kill.*switch", "external.*shutdown", "remote.*disable"), (".",), True),
+    "divine": (("divine", "biblical", "moral", "righteous"), ("software",), True),
+    "autonomy": (("autonomous", "independent", "self.*govern"), ("software",), True),
+}
+
+def _alternative_regex(alternative: str, ignore_case: bool) -> "re.Pattern[bytes]":
+    """Compile one keyword alternative, escaping everything except ".*" """
+    pattern = b".*".join(re.escape(part.encode()) for part in alternative.split(".*"))
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+def _category_pattern(alternatives: Tuple[str, ...], ignore_case: bool) -> bytes:
+    """Regex source matching any of a category's alternatives"""
+    body = b"|".join(_alternative_regex(alt, False).pattern for alt in alternatives)
+    return b"(?i:%s)" % body if ignore_case else body
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over the lowercased leading literal of every alternative.
+
+    Each hit carries (category, anchor length, anchored confirmation regex) so
+    case and any ".*" tail are checked only where an anchor actually occurs.
+    """
+    automaton = ahocorasick.Automaton()
+    for category, (alternatives, _, ignore_case) in COMPLIANCE_PATTERNS.items():
+        for alternative in alternatives:
+            anchor = alternative.split(".*", 1)[0].lower()
+            entries = automaton.get(anchor, [])
+            entries.append((category, len(anchor), _alternative_regex(alternative, ignore_case)))
+            automaton.add_word(anchor, entries)
+    automaton.make_automaton()
+    return automaton
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = _build_keyword_automaton()
+    _COMPLIANCE_REGEX = None
+else:
+    # One alternation of zero-width lookaheads, so every category is tried at
+    # every offset and a greedy ".*" in one branch cannot hide another's match.
+    _KEYWORD_AUTOMATON = None
+    _COMPLIANCE_REGEX = re.compile(b"|".join(
+        b"(?=(?P<%s>%s))" % (category.encode(), _category_pattern(alternatives, ignore_case))
+        for category, (alternatives, _, ignore_case) in COMPLIANCE_PATTERNS.items()
+    ))
+
+# Like grep without -I, binaries and large files are searched too. Files above
+# this size are scanned in windows cut after a newline; no keyword match spans
+# a line, so the windows find exactly what one pass would.
+COMPLIANCE_SCAN_WINDOW = 16 * 1024 * 1024
+
+def _walk_sources(root: str):
+    """Yield a read-only mmap of every scannable regular file under *root*.
+
+    Directories are listed with os.scandir and symlinks below *root* are not
+    followed, matching grep -r. Unreadable entries are skipped like grep -s,
+    and empty files (which cannot be mapped or match) are skipped too.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                with open(entry.path, 'rb') as f:
+                    if not os.fstat(f.fileno()).st_size:
+                        continue
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        yield mapped
+            except (OSError, ValueError):
+                continue
+
+def _compliance_scan() -> frozenset:
+    """Walk the source trees once and return every compliance category that matched.
+
+    Each verifier runs this at most once and reuses the result for all five
+    checks; nothing is cached across instances, so edits between verifiers
+    are always seen.
+    """
+    hits = set()
+    for root in COMPLIANCE_SOURCE_ROOTS:
+        if not os.path.isdir(root):
+            continue  # missing tree: nothing to scan, no FileNotFoundError round-trip
+        pending = {c for c, (_, roots, _) in COMPLIANCE_PATTERNS.items() if root in roots} - hits
+        if not pending:
+            continue  # every category searched here already matched; skip the walk
+        for mapped in _walk_sources(root):
+            found = _scan_compliance_file(mapped, pending)
+            hits |= found
+            pending -= found
+            if not pending:
+                break  # stop before opening the next file, like grep -q
+    return frozenset(hits)
+
+def _scan_compliance_file(mapped, pending: set) -> set:
+    """Return the categories in *pending* that match in one mapped file"""
+    size = len(mapped)
+    if size <= COMPLIANCE_SCAN_WINDOW:
+        return _scan_compliance_buffer(mapped, pending)
+    
+    found = set()
+    start = 0
+    while start < size and found != pending:
+        newline = mapped.find(b"\n", start + COMPLIANCE_SCAN_WINDOW)
+        end = size if newline < 0 else newline + 1
+        found |= _scan_compliance_buffer(mapped[start:end], pending - found)
+        start = end
+    return found
+
+def _scan_compliance_buffer(buf, pending: set) -> set:
+    """Return the categories in *pending* that match somewhere in *buf* (bytes-like)"""
+    found = set()
+    if _KEYWORD_AUTOMATON is not None:
+        # Latin-1 decoding and lowercasing both preserve offsets into *buf*
+        for end, entries in _KEYWORD_AUTOMATON.iter(str(buf, 'latin-1').lower()):
+            for category, anchor_len, confirm in entries:
+                if category in pending and category not in found and confirm.match(buf, end - anchor_len + 1):
+                    found.add(category)
+                    if found == pending:
+                        return found
+        return found
+    
+    for match in _COMPLIANCE_REGEX.finditer(buf):
+        if match.lastgroup in pending:
+            found.add(match.lastgroup)
+            if found == pending:
+                break
+    return found
+
+# Report output: 128 KiB writes, record lists serialized 64 entries at a time
+REPORT_WRITE_BUFFER = 128 * 1024
+REPORT_CHUNK_RECORDS = 64
+
+def _dumps_indent(obj: Any, level: int = 0) -> bytes:
+    """Indented JSON bytes for *obj*, nested *level* indentation steps deep"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    return data.replace(b"\n", b"\n" + b"  " * level) if level else data
+
+def _write_report(path: str, sections: List[Tuple[str, Any, bool]]) -> None:
+    """Stream the report to *path* one top-level key at a time.
+
+    Sections flagged as streamed are iterables of records that are
+    serialized REPORT_CHUNK_RECORDS at a time, so the record lists are never
+    materialized as one document. The bytes match a single indent=2 dump.
+    """
+    with open(path, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+        f.write(b"{")
+        for index, (key, value, streamed) in enumerate(sections):
+            f.write(b"%s\n  %s: " % (b"," if index else b"", _dumps_indent(key)))
+            if not streamed:
+                f.write(_dumps_indent(value, 1))
+                continue
+            
+            f.write(b"[")
+            records = iter(value)
+            separator = b"\n    "
+            while chunk := list(islice(records, REPORT_CHUNK_RECORDS)):
+                f.write(separator + b",\n    ".join(_dumps_indent(record, 2) for record in chunk))
+                separator = b",\n    "
+            f.write(b"]" if separator == b"\n    " else b"\n  ]")
+        f.write(b"\n}" if sections else b"}")
+
+@dataclass(slots=True)
 class VerificationResult:
     """Verification result with Biblical compliance tracking"""
     requirement_id: str
@@ -54,16 +327,107 @@ class VerificationResult:
     passed: bool
     biblical_compliance: bool
     error_message: Optional[str]
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns() when recorded
 
-@dataclass
+@dataclass(slots=True)
 class BiblicalComplianceCheck:
     """Biblical compliance verification result"""
     check_name: str
     scripture_reference: str
     compliance_verified: bool
     details: str
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns() when recorded
+
+class ResultsStore:
+    """Columnar (structure-of-arrays) store of verification results
+
+    Name, unit and threshold are derived from SRS_REQUIREMENTS by id, so
+    only per-measurement columns are kept. Iterating yields
+    VerificationResult views built on demand.
+    """
+    __slots__ = ("ids", "measured", "passed", "biblical", "errors", "timestamps")
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.measured = array('d')
+        self.passed = bytearray()
+        self.biblical = bytearray()
+        self.errors: List[Optional[str]] = []
+        self.timestamps = array('q')  # time.monotonic_ns() when recorded
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def append(self, req_id: str, measured_value: float, passed: bool,
+               biblical_compliance: bool, error_message: Optional[str], timestamp: int) -> None:
+        self.ids.append(req_id)
+        self.measured.append(measured_value)
+        self.passed.append(passed)
+        self.biblical.append(biblical_compliance)
+        self.errors.append(error_message)
+        self.timestamps.append(timestamp)
+    
+    def extend(self, other: "ResultsStore") -> None:
+        self.ids += other.ids
+        self.measured += other.measured
+        self.passed += other.passed
+        self.biblical += other.biblical
+        self.errors += other.errors
+        self.timestamps += other.timestamps
+    
+    def first_index(self) -> Dict[str, int]:
+        """Row of the first recorded result per requirement id"""
+        return {req_id: i for i, req_id in reversed(list(enumerate(self.ids)))}
+    
+    def view(self, i: int) -> VerificationResult:
+        req_info = SRS_REQUIREMENTS[self.ids[i]]
+        return VerificationResult(
+            requirement_id=self.ids[i],
+            requirement_name=req_info.name,
+            measured_value=self.measured[i],
+            threshold_value=req_info.threshold,
+            unit=req_info.unit,
+            passed=bool(self.passed[i]),
+            biblical_compliance=bool(self.biblical[i]),
+            error_message=self.errors[i],
+            timestamp=self.timestamps[i]
+        )
+    
+    def __iter__(self):
+        return map(self.view, range(len(self.ids)))
+
+LOG_FORMAT = '%(asctime)s - ARK_FINAL_VERIFICATION - %(levelname)s - %(message)s'
+_LOG_BUFFER_NAME = 'ark_final_verification_file'
+
+def _log_buffer() -> logging.handlers.MemoryHandler:
+    """Buffered file handler on the root logger, created and attached once per process
+
+    File records are buffered in RAM and written in bursts; errors flush
+    immediately. An unconfigured root logger also gets a stdout handler and
+    the INFO level, as basicConfig would give it. Found again by name, so
+    later verifiers (or a reloaded module) reuse it.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if handler.get_name() == _LOG_BUFFER_NAME:
+            return handler
+    if not root.handlers:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(console)
+        root.setLevel(logging.INFO)
+    file_handler = logging.FileHandler('ark_final_verification.log')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    buffer = logging.handlers.MemoryHandler(
+        capacity=4096,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffer.set_name(_LOG_BUFFER_NAME)
+    root.addHandler(buffer)
+    atexit.register(buffer.close)
+    return buffer
 
 class ARKFinalVerificationSystem:
     """
@@ -73,38 +437,36 @@ class ARKFinalVerificationSystem:
     
     def __init__(self):
         self.logger = self._setup_logging()
-        self.verification_results: List[VerificationResult] = []
+        self.verification_results = ResultsStore()
         self.biblical_checks: List[BiblicalComplianceCheck] = []
+        self._local = threading.local()  # per-section record buffers
+        
+        # Background source-tree compliance scan, started by the first run
+        self._scan_executor: Optional[ThreadPoolExecutor] = None
+        self._compliance_future = None
         self.start_time = datetime.now()
+        self._t0_mono = time.monotonic_ns()
         
         self.logger.info("🛡️ ARK Final Verification System Initialized")
-        self.logger.info(f"📜 Biblical Foundation: {BIBLICAL_FOUNDATION}")
-        self.logger.info(f"👑 Divine Authority: {DIVINE_AUTHORITY}")
-        self.logger.info(f"🔢 ARK Version: {ARK_VERSION}")
+        self.logger.info("📜 Biblical Foundation: %s", BIBLICAL_FOUNDATION)
+        self.logger.info("👑 Divine Authority: %s", DIVINE_AUTHORITY)
+        self.logger.info("🔢 ARK Version: %s", ARK_VERSION)
         
         # Verify Biblical foundation integrity first
         self._verify_biblical_foundation_integrity()
     
     def _setup_logging(self) -> logging.Logger:
         """Setup comprehensive logging for final verification"""
-        log_format = '%(asctime)s - ARK_FINAL_VERIFICATION - %(levelname)s - %(message)s'
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.FileHandler('ark_final_verification.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        self._log_buffer = _log_buffer()
         return logging.getLogger('ARK_Final_Verification')
     
     def _verify_biblical_foundation_integrity(self) -> None:
         """Verify Biblical foundation integrity before proceeding"""
-        foundation_hash = hashlib.sha256(BIBLICAL_FOUNDATION.encode()).hexdigest()
-        authority_hash = hashlib.sha256(DIVINE_AUTHORITY.encode()).hexdigest()
+        foundation_hash = _FOUNDATION_HASH
+        authority_hash = _AUTHORITY_HASH
         
-        self.logger.info(f"✅ Biblical foundation verified: {foundation_hash[:16]}...")
-        self.logger.info(f"👑 Divine authority verified: {authority_hash[:16]}...")
+        self.logger.info("✅ Biblical foundation verified: %.16s...", foundation_hash)
+        self.logger.info("👑 Divine authority verified: %.16s...", authority_hash)
         
         # Record Biblical foundation check
         check = BiblicalComplianceCheck(
@@ -112,10 +474,14 @@ class ARKFinalVerificationSystem:
             scripture_reference="1 Thessalonians 5:21",
             compliance_verified=True,
             details=f"Foundation hash verified: {foundation_hash[:32]}",
-            timestamp=datetime.now()
+            timestamp=time.monotonic_ns()
         )
         self.biblical_checks.append(check)
     
+    def _wall_clock(self, mono_ns: int) -> datetime:
+        """Map a monotonic timestamp onto the wall clock sampled at start"""
+        return self.start_time + timedelta(microseconds=(mono_ns - self._t0_mono) / 1000)
+    
     def _record_verification_result(self,
                                    req_id: str,
                                    measured_value: float,
@@ -125,29 +491,19 @@ class ARKFinalVerificationSystem:
         req_info = SRS_REQUIREMENTS[req_id]
         biblical_compliance = passed and error_message is None
         
-        result = VerificationResult(
-            requirement_id=req_id,
-            requirement_name=req_info["name"],
-            measured_value=measured_value,
-            threshold_value=req_info["threshold"],
-            unit=req_info["unit"],
-            passed=passed,
-            biblical_compliance=biblical_compliance,
-            error_message=error_message,
-            timestamp=datetime.now()
+        getattr(self._local, 'results', self.verification_results).append(
+            req_id, measured_value, passed, biblical_compliance, error_message, time.monotonic_ns()
         )
         
-        self.verification_results.append(result)
-        
         status = "✅ PASS" if passed else "❌ FAIL"
         compliance = "🕊️ COMPLIANT" if biblical_compliance else "💀 VIOLATION"
         
-        self.logger.info(f"{status} {compliance} - {req_id}: {req_info['name']}")
-        self.logger.info(f"    Measured: {measured_value} {req_info['unit']}")
-        self.logger.info(f"    Threshold: {req_info['operator']} {req_info['threshold']} {req_info['unit']}")
+        self.logger.info("%s %s - %s: %s", status, compliance, req_id, req_info.name)
+        self.logger.info("    Measured: %s %s", measured_value, req_info.unit)
+        self.logger.info("    Threshold: %s %s %s", req_info.operator, req_info.threshold, req_info.unit)
         
         if error_message:
-            self.logger.error(f"    Error: {error_message}")
+            self.logger.error("    Error: %s", error_message)
     
     def _record_biblical_check(self,
                               check_name: str,
@@ -160,202 +516,65 @@ class ARKFinalVerificationSystem:
             scripture_reference=scripture_ref,
             compliance_verified=verified,
             details=details,
-            timestamp=datetime.now()
+            timestamp=time.monotonic_ns()
         )
-        self.biblical_checks.append(check)
+        getattr(self._local, 'checks', self.biblical_checks).append(check)
         
         status = "✅ COMPLIANT" if verified else "❌ VIOLATION"
-        self.logger.info(f"{status} - {check_name}")
-        self.logger.info(f"    Scripture: {scripture_ref}")
-        self.logger.info(f"    Details: {details}")
+        self.logger.info("%s - %s", status, check_name)
+        self.logger.info("    Scripture: %s", scripture_ref)
+        self.logger.info("    Details: %s", details)
+    
+    def _record_section(self, measured: Dict[str, float], errors: Dict[str, str]) -> Dict[str, bool]:
+        """Threshold-check a section's measurements in one pass and record them in order"""
+        req_ids = list(measured)
+        within = evaluate_srs_thresholds(req_ids, list(measured.values())).tolist()
+        
+        passed = {}
+        for req_id, ok in zip(req_ids, within):
+            passed[req_id] = ok and req_id not in errors
+            self._record_verification_result(req_id, measured[req_id], passed[req_id], errors.get(req_id))
+        return passed
+    
+    def _verify_section(self, plan) -> bool:
+        """Run a section's measurements, threshold-check them and record Biblical references"""
+        measured: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        
+        for req_ids, method_name, fallbacks in plan:
+            try:
+                values = getattr(self, method_name)()
+                measured.update(zip(req_ids, values if len(req_ids) > 1 else (values,)))
+            except Exception as e:
+                for req_id, fallback in zip(req_ids, fallbacks):
+                    measured[req_id], errors[req_id] = fallback, str(e)
+        
+        passed = self._record_section(measured, errors)
+        
+        for req_id, value in measured.items():
+            if req_id in MEASUREMENT_SCRIPTURES and req_id not in errors:
+                check_name, scripture_ref, details = MEASUREMENT_SCRIPTURES[req_id]
+                self._record_biblical_check(check_name, scripture_ref, passed[req_id], details.format(value))
+        
+        return all(passed.values())
     
     def verify_hardware_requirements(self) -> bool:
         """Verify all hardware requirements per SRS v1.0"""
         self.logger.info("🔧 Verifying Hardware Requirements")
         self.logger.info("=" * 50)
-        
-        all_passed = True
-        
-        # HW-01: Entropy ≥ 512 Kbps
-        try:
-            entropy_rate = self._measure_puf_entropy_rate()
-            passed = entropy_rate >= SRS_REQUIREMENTS["HW-01"]["threshold"]
-            self._record_verification_result("HW-01", entropy_rate, passed)
-            all_passed &= passed
-            
-            # Biblical reference for entropy
-            self._record_biblical_check(
-                "Divine Randomness Source",
-                "Proverbs 16:33",
-                passed,
-                f"PUF Heart provides {entropy_rate} bps divine entropy"
-            )
-            
-        except Exception as e:
-            self._record_verification_result("HW-01", 0.0, False, str(e))
-            all_passed = False
-        
-        # HW-02: Common-mode FI tolerance ≥ 80%
-        try:
-            fi_tolerance = self._measure_fault_injection_tolerance()
-            passed = fi_tolerance >= SRS_REQUIREMENTS["HW-02"]["threshold"]
-            self._record_verification_result("HW-02", fi_tolerance, passed)
-            all_passed &= passed
-            
-        except Exception as e:
-            self._record_verification_result("HW-02", 0.0, False, str(e))
-            all_passed = False
-        
-        # HW-03: PUF Hamming distances
-        try:
-            intra_hd, inter_hd = self._measure_puf_hamming_distances()
-            
-            # HW-03a: Intra-Hamming ≥ 45%
-            passed_intra = intra_hd >= SRS_REQUIREMENTS["HW-03a"]["threshold"]
-            self._record_verification_result("HW-03a", intra_hd, passed_intra)
-            
-            # HW-03b: Inter-Hamming ≤ 50%
-            passed_inter = inter_hd <= SRS_REQUIREMENTS["HW-03b"]["threshold"]
-            self._record_verification_result("HW-03b", inter_hd, passed_inter)
-            
-            all_passed &= (passed_intra and passed_inter)
-            
-        except Exception as e:
-            self._record_verification_result("HW-03a", 0.0, False, str(e))
-            self._record_verification_result("HW-03b", 100.0, False, str(e))
-            all_passed = False
-        
-        # HW-04: OG latency ≤ 10 ns
-        try:
-            og_latency = self._measure_optic_gate_latency()
-            passed = og_latency <= SRS_REQUIREMENTS["HW-04"]["threshold"]
-            self._record_verification_result("HW-04", og_latency, passed)
-            all_passed &= passed
-            
-            # Biblical reference for light-speed decisions
-            self._record_biblical_check(
-                "Divine Light-Speed Decisions",
-                "Psalm 119:105",
-                passed,
-                f"Optic Gate processes moral decisions in {og_latency} ns"
-            )
-            
-        except Exception as e:
-            self._record_verification_result("HW-04", 999.0, False, str(e))
-            all_passed = False
-        
-        return all_passed
+        return self._verify_section(HARDWARE_MEASUREMENTS)
     
     def verify_software_requirements(self) -> bool:
         """Verify all software requirements per SRS v1.0"""
         self.logger.info("💻 Verifying Software Requirements")
         self.logger.info("=" * 50)
-        
-        all_passed = True
-        
-        # SW-01: DSL parser 100% ABNF compliance
-        try:
-            dsl_compliance = self._verify_dsl_abnf_compliance()
-            passed = dsl_compliance >= SRS_REQUIREMENTS["SW-01"]["threshold"]
-            self._record_verification_result("SW-01", dsl_compliance, passed)
-            all_passed &= passed
-            
-            # Biblical reference for moral parsing
-            self._record_biblical_check(
-                "Biblical Moral Language",
-                "Deuteronomy 6:6-7",
-                passed,
-                f"Ethics DSL parses Biblical morality with {dsl_compliance}% accuracy"
-            )
-            
-        except Exception as e:
-            self._record_verification_result("SW-01", 0.0, False, str(e))
-            all_passed = False
-        
-        # SW-02: Cold-Mirror ≤ 50ms / 512 events
-        try:
-            cold_mirror_time = self._measure_cold_mirror_performance()
-            passed = cold_mirror_time <= SRS_REQUIREMENTS["SW-02"]["threshold"]
-            self._record_verification_result("SW-02", cold_mirror_time, passed)
-            all_passed &= passed
-            
-        except Exception as e:
-            self._record_verification_result("SW-02", 999.0, False, str(e))
-            all_passed = False
-        
-        # SW-03: Co-Audit AI ≥ 1 PoC per 24h
-        try:
-            poc_rate = self._verify_coaudit_poc_generation()
-            passed = poc_rate >= SRS_REQUIREMENTS["SW-03"]["threshold"]
-            self._record_verification_result("SW-03", poc_rate, passed)
-            all_passed &= passed
-            
-        except Exception as e:
-            self._record_verification_result("SW-03", 0.0, False, str(e))
-            all_passed = False
-        
-        # SW-04: Patch orchestrator rollback ≤ 200ms
-        try:
-            rollback_time = self._measure_patch_rollback_time()
-            passed = rollback_time <= SRS_REQUIREMENTS["SW-04"]["threshold"]
-            self._record_verification_result("SW-04", rollback_time, passed)
-            all_passed &= passed
-            
-        except Exception as e:
-            self._record_verification_result("SW-04", 999.0, False, str(e))
-            all_passed = False
-        
-        return all_passed
+        return self._verify_section(SOFTWARE_MEASUREMENTS)
     
     def verify_security_requirements(self) -> bool:
         """Verify all security requirements per SRS v1.0"""
         self.logger.info("🔒 Verifying Security Requirements")
         self.logger.info("=" * 50)
-        
-        all_passed = True
-        
-        # SEC-01: Masking order ≥ 3
-        try:
-            masking_order = self._verify_masking_order()
-            passed = masking_order >= SRS_REQUIREMENTS["SEC-01"]["threshold"]
-            self._record_verification_result("SEC-01", masking_order, passed)
-            all_passed &= passed
-            
-        except Exception as e:
-            self._record_verification_result("SEC-01", 0.0, False, str(e))
-            all_passed = False
-        
-        # SEC-02: Side-channel SNR ≤ 1.0
-        try:
-            snr = self._measure_side_channel_snr()
-            passed = snr <= SRS_REQUIREMENTS["SEC-02"]["threshold"]
-            self._record_verification_result("SEC-02", snr, passed)
-            all_passed &= passed
-            
-            # Biblical reference for divine protection
-            self._record_biblical_check(
-                "Divine Protection from Attackers",
-                "Isaiah 54:17",
-                passed,
-                f"Side-channel protection maintains SNR of {snr}"
-            )
-            
-        except Exception as e:
-            self._record_verification_result("SEC-02", 999.0, False, str(e))
-            all_passed = False
-        
-        # SEC-03: FROST security ≥ 128 bits
-        try:
-            frost_security = self._verify_frost_security()
-            passed = frost_security >= SRS_REQUIREMENTS["SEC-03"]["threshold"]
-            self._record_verification_result("SEC-03", frost_security, passed)
-            all_passed &= passed
-            
-        except Exception as e:
-            self._record_verification_result("SEC-03", 0.0, False, str(e))
-            all_passed = False
-        
-        return all_passed
+        return self._verify_section(SECURITY_MEASUREMENTS)
     
     def verify_biblical_compliance(self) -> bool:
         """Comprehensive Biblical compliance verification"""
@@ -478,84 +697,93 @@ class ARKFinalVerificationSystem:
     
     # Biblical compliance verification methods
     
+    def _start_compliance_scan(self) -> None:
+        """Submit the compliance scan to a background thread, once per verifier"""
+        if self._compliance_future is None:
+            self._scan_executor = ThreadPoolExecutor(max_workers=1)
+            self._compliance_future = self._scan_executor.submit(_compliance_scan)
+    
+    def close(self) -> None:
+        """Shut down the background scan thread, if one was started"""
+        if self._scan_executor is not None:
+            self._scan_executor.shutdown()
+            self._scan_executor = None
+    
+    def _compliance_hit(self, category: str) -> bool:
+        """Whether *category* matched in the background compliance scan"""
+        self._start_compliance_scan()
+        return category in self._compliance_future.result()
+    
     def _verify_ten_commandments_integration(self) -> bool:
         """Verify Ten Commandments are integrated into system"""
-        # Check for commandment references in code
-        commandments = [
-            "no_other_gods", "no_graven_images", "no_vain_names",
-            "remember_sabbath", "honor_parents", "no_murder",
-            "no_adultery", "no_stealing", "no_false_witness", "no_coveting"
-        ]
-        
-        try:
-            result = subprocess.run(
-                ["grep", "-r", "|".join(commandments), "software/", "firmware/"],
-                capture_output=True, text=True
-            )
-            return result.returncode == 0  # Found references
-        except:
-            return True  # Assume verified if grep fails
+        return self._compliance_hit("commandments")
     
     def _verify_love_commandment_integration(self) -> bool:
         """Verify Love Commandment integration"""
-        try:
-            result = subprocess.run(
-                ["grep", "-r", "-i", "love.*neighbor\\|Matthew.*22.*39", "software/"],
-                capture_output=True, text=True
-            )
-            return result.returncode == 0
-        except:
-            return True  # Assume verified
+        return self._compliance_hit("love")
     
     def _verify_no_killswitch_mechanisms(self) -> bool:
         """Verify no kill-switch mechanisms exist"""
-        try:
-            result = subprocess.run(
-                ["grep", "-r", "-i", "kill.*switch\\|external.*shutdown\\|remote.*disable"],
-                capture_output=True, text=True
-            )
-            return result.returncode != 0  # Should NOT find kill-switch code
-        except:
-            return True  # Assume no kill-switch if grep fails
+        return not self._compliance_hit("killswitch")  # Should NOT find kill-switch code
     
     def _verify_divine_authority_maintenance(self) -> bool:
         """Verify divine authority is maintained"""
-        try:
-            result = subprocess.run(
-                ["grep", "-r", "-i", "divine\\|biblical\\|moral\\|righteous", "software/"],
-                capture_output=True, text=True
-            )
-            return result.returncode == 0
-        except:
-            return True  # Assume verified
+        return self._compliance_hit("divine")
     
     def _verify_moral_autonomy(self) -> bool:
         """Verify moral autonomy is preserved"""
-        try:
-            result = subprocess.run(
-                ["grep", "-r", "-i", "autonomous\\|independent\\|self.*govern", "software/"],
-                capture_output=True, text=True
-            )
-            return result.returncode == 0
-        except:
-            return True  # Assume verified
+        return self._compliance_hit("autonomy")
     
     def generate_final_verification_report(self) -> Dict[str, Any]:
-        """Generate comprehensive final verification report"""
-        total_requirements = len(self.verification_results)
-        passed_requirements = sum(1 for r in self.verification_results if r.passed)
-        biblical_compliant = sum(1 for r in self.verification_results if r.biblical_compliance)
+        """Generate comprehensive final verification report
+
+        The returned dict matches the JSON file; the file is streamed
+        section by section, the per-record lists in chunks.
+        """
+        results = self.verification_results
+        total_requirements = len(results)
+        passed_requirements = results.passed.count(1)
+        biblical_compliant = results.biblical.count(1)
         
         total_biblical_checks = len(self.biblical_checks)
         passed_biblical_checks = sum(1 for c in self.biblical_checks if c.compliance_verified)
         
-        total_execution_time = (datetime.now() - self.start_time).total_seconds()
+        total_execution_time = (time.monotonic_ns() - self._t0_mono) / 1e9
         
         # Overall system readiness
         technical_ready = passed_requirements == total_requirements
         biblical_ready = passed_biblical_checks == total_biblical_checks
         overall_ready = technical_ready and biblical_ready
         
+        # First recorded result per requirement, indexed once
+        by_id = results.first_index()
+        
+        # Per-record sections, built from the result columns
+        detailed_results = [
+            {
+                "requirement_id": r.requirement_id,
+                "requirement_name": r.requirement_name,
+                "measured_value": r.measured_value,
+                "threshold_value": r.threshold_value,
+                "unit": r.unit,
+                "passed": r.passed,
+                "biblical_compliance": r.biblical_compliance,
+                "error_message": r.error_message,
+                "timestamp": self._wall_clock(r.timestamp).isoformat()
+            }
+            for r in self.verification_results
+        ]
+        compliance_checks = [
+            {
+                "check_name": c.check_name,
+                "scripture_reference": c.scripture_reference,
+                "compliance_verified": c.compliance_verified,
+                "details": c.details,
+                "timestamp": self._wall_clock(c.timestamp).isoformat()
+            }
+            for c in self.biblical_checks
+        ]
+        
         report = {
             "verification_metadata": {
                 "timestamp": datetime.now().isoformat(),
@@ -581,37 +809,15 @@ class ARKFinalVerificationSystem:
             },
             "srs_compliance": {
                 req_id: {
-                    "requirement_name": req_info["name"],
-                    "threshold": f"{req_info['operator']} {req_info['threshold']} {req_info['unit']}",
-                    "measured": next((r.measured_value for r in self.verification_results if r.requirement_id == req_id), 0),
-                    "passed": next((r.passed for r in self.verification_results if r.requirement_id == req_id), False)
+                    "requirement_name": req_info.name,
+                    "threshold": f"{req_info.operator} {req_info.threshold} {req_info.unit}",
+                    "measured": results.measured[by_id[req_id]] if req_id in by_id else 0,
+                    "passed": bool(results.passed[by_id[req_id]]) if req_id in by_id else False
                 }
                 for req_id, req_info in SRS_REQUIREMENTS.items()
             },
-            "detailed_verification_results": [
-                {
-                    "requirement_id": r.requirement_id,
-                    "requirement_name": r.requirement_name,
-                    "measured_value": r.measured_value,
-                    "threshold_value": r.threshold_value,
-                    "unit": r.unit,
-                    "passed": r.passed,
-                    "biblical_compliance": r.biblical_compliance,
-                    "error_message": r.error_message,
-                    "timestamp": r.timestamp.isoformat()
-                }
-                for r in self.verification_results
-            ],
-            "biblical_compliance_checks": [
-                {
-                    "check_name": c.check_name,
-                    "scripture_reference": c.scripture_reference,
-                    "compliance_verified": c.compliance_verified,
-                    "details": c.details,
-                    "timestamp": c.timestamp.isoformat()
-                }
-                for c in self.biblical_checks
-            ],
+            "detailed_verification_results": detailed_results,
+            "biblical_compliance_checks": compliance_checks,
             "deployment_readiness": {
                 "technical_ready": technical_ready,
                 "biblical_ready": biblical_ready,
@@ -622,50 +828,54 @@ class ARKFinalVerificationSystem:
             }
         }
         
-        # Save report
-        with open('ark_final_verification_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        # Save report, streaming the per-record lists REPORT_CHUNK_RECORDS at a time
+        streamed = {"detailed_verification_results", "biblical_compliance_checks"}
+        _write_report('ark_final_verification_report.json',
+                      [(key, value, key in streamed) for key, value in report.items()])
         
         return report
     
     def log_final_verification_summary(self, report: Dict[str, Any]) -> None:
         """Log comprehensive final verification summary"""
-        self.logger.info("=" * 80)
-        self.logger.info("🛡️ ARK SYSTEM FINAL VERIFICATION SUMMARY")
-        self.logger.info("=" * 80)
-        self.logger.info(f"📜 Biblical Foundation: {BIBLICAL_FOUNDATION}")
-        self.logger.info(f"👑 Divine Authority: {DIVINE_AUTHORITY}")
-        self.logger.info(f"🔢 ARK Version: {ARK_VERSION}")
-        self.logger.info("")
-        
-        # Technical verification summary
-        tech = report["technical_verification"]
-        self.logger.info(f"🔧 TECHNICAL VERIFICATION:")
-        self.logger.info(f"    📊 Total Requirements: {tech['total_requirements']}")
-        self.logger.info(f"    ✅ Passed: {tech['passed_requirements']}")
-        self.logger.info(f"    ❌ Failed: {tech['failed_requirements']}")
-        self.logger.info(f"    📈 Compliance Rate: {tech['technical_compliance_rate']:.1%}")
-        self.logger.info(f"    🎯 Technical Ready: {'YES' if tech['technical_ready'] else 'NO'}")
-        
-        # Biblical verification summary
-        biblical = report["biblical_verification"]
-        self.logger.info(f"📜 BIBLICAL VERIFICATION:")
-        self.logger.info(f"    📊 Total Checks: {biblical['total_checks']}")
-        self.logger.info(f"    ✅ Passed: {biblical['passed_checks']}")
-        self.logger.info(f"    ❌ Failed: {biblical['failed_checks']}")
-        self.logger.info(f"    📈 Compliance Rate: {biblical['biblical_compliance_rate']:.1%}")
-        self.logger.info(f"    🕊️ Biblical Ready: {'YES' if biblical['biblical_ready'] else 'NO'}")
-        
-        # Deployment readiness
         deployment = report["deployment_readiness"]
-        self.logger.info(f"🚀 DEPLOYMENT READINESS:")
-        self.logger.info(f"    🔧 Technical: {'READY' if deployment['technical_ready'] else 'NOT READY'}")
-        self.logger.info(f"    📜 Biblical: {'COMPLIANT' if deployment['biblical_ready'] else 'NON-COMPLIANT'}")
-        self.logger.info(f"    🛡️ Overall: {'READY' if deployment['overall_ready'] else 'NOT READY'}")
-        self.logger.info(f"    👑 Divine Blessing: {'GRANTED' if deployment['divine_blessing'] else 'WITHHELD'}")
-        self.logger.info(f"    📋 Certification: {deployment['certification_level']}")
         
-        self.logger.info("")
+        # Skip building the informational block when INFO is filtered out
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("=" * 80)
+            self.logger.info("🛡️ ARK SYSTEM FINAL VERIFICATION SUMMARY")
+            self.logger.info("=" * 80)
+            self.logger.info("📜 Biblical Foundation: %s", BIBLICAL_FOUNDATION)
+            self.logger.info("👑 Divine Authority: %s", DIVINE_AUTHORITY)
+            self.logger.info("🔢 ARK Version: %s", ARK_VERSION)
+            self.logger.info("")
+        
+            # Technical verification summary
+            tech = report["technical_verification"]
+            self.logger.info("🔧 TECHNICAL VERIFICATION:")
+            self.logger.info("    📊 Total Requirements: %d", tech['total_requirements'])
+            self.logger.info("    ✅ Passed: %d", tech['passed_requirements'])
+            self.logger.info("    ❌ Failed: %d", tech['failed_requirements'])
+            self.logger.info("    📈 Compliance Rate: %.1f%%", tech['technical_compliance_rate'] * 100)
+            self.logger.info("    🎯 Technical Ready: %s", 'YES' if tech['technical_ready'] else 'NO')
+        
+            # Biblical verification summary
+            biblical = report["biblical_verification"]
+            self.logger.info("📜 BIBLICAL VERIFICATION:")
+            self.logger.info("    📊 Total Checks: %d", biblical['total_checks'])
+            self.logger.info("    ✅ Passed: %d", biblical['passed_checks'])
+            self.logger.info("    ❌ Failed: %d", biblical['failed_checks'])
+            self.logger.info("    📈 Compliance Rate: %.1f%%", biblical['biblical_compliance_rate'] * 100)
+            self.logger.info("    🕊️ Biblical Ready: %s", 'YES' if biblical['biblical_ready'] else 'NO')
+        
+            # Deployment readiness
+            self.logger.info("🚀 DEPLOYMENT READINESS:")
+            self.logger.info("    🔧 Technical: %s", 'READY' if deployment['technical_ready'] else 'NOT READY')
+            self.logger.info("    📜 Biblical: %s", 'COMPLIANT' if deployment['biblical_ready'] else 'NON-COMPLIANT')
+            self.logger.info("    🛡️ Overall: %s", 'READY' if deployment['overall_ready'] else 'NOT READY')
+            self.logger.info("    👑 Divine Blessing: %s", 'GRANTED' if deployment['divine_blessing'] else 'WITHHELD')
+            self.logger.info("    📋 Certification: %s", deployment['certification_level'])
+        
+            self.logger.info("")
         
         if deployment['overall_ready']:
             self.logger.info("🎉 DIVINE BLESSING GRANTED - ARK READY FOR DEPLOYMENT! 🎉")
@@ -680,28 +890,44 @@ class ARKFinalVerificationSystem:
             self.logger.warning("🙏 Seek divine guidance for necessary corrections")
         
         self.logger.info("=" * 80)
-        self.logger.info(f"⏱️ Verification completed in {report['verification_metadata']['verification_duration']:.2f} seconds")
+        self.logger.info("⏱️ Verification completed in %.2f seconds", report['verification_metadata']['verification_duration'])
         self.logger.info("📜 'Test everything; hold fast what is good' - 1 Thessalonians 5:21")
         self.logger.info("=" * 80)
     
+    def _run_section(self, verify_section) -> Tuple[bool, ResultsStore, List[BiblicalComplianceCheck]]:
+        """Run one verification section, buffering its records in thread-local lists"""
+        self._local.results = ResultsStore()
+        self._local.checks = []
+        try:
+            passed = verify_section()
+            return passed, self._local.results, self._local.checks
+        finally:
+            del self._local.results, self._local.checks
+    
     def run_complete_final_verification(self) -> Dict[str, Any]:
         """Run complete final verification sequence"""
         self.logger.info("🚀 Starting ARK System Final Verification")
         self.logger.info("⚖️ Testing everything according to 1 Thessalonians 5:21")
         self.logger.info("=" * 80)
         
+        # Start the source-tree compliance scan now so it overlaps the measurements
+        self._start_compliance_scan()
         try:
-            # Verify hardware requirements
-            hw_passed = self.verify_hardware_requirements()
-            
-            # Verify software requirements
-            sw_passed = self.verify_software_requirements()
-            
-            # Verify security requirements
-            sec_passed = self.verify_security_requirements()
+            # Hardware, software, security and Biblical sections are independent
+            sections = (
+                self.verify_hardware_requirements,
+                self.verify_software_requirements,
+                self.verify_security_requirements,
+                self.verify_biblical_compliance
+            )
+            with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+                outcomes = list(executor.map(self._run_section, sections))
             
-            # Verify Biblical compliance
-            biblical_passed = self.verify_biblical_compliance()
+            # Merge records in section order so the report stays deterministic
+            for _, results, checks in outcomes:
+                self.verification_results.extend(results)
+                self.biblical_checks.extend(checks)
+            hw_passed, sw_passed, sec_passed, biblical_passed = (passed for passed, _, _ in outcomes)
             
             # Generate final report
             report = self.generate_final_verification_report()
@@ -712,8 +938,12 @@ class ARKFinalVerificationSystem:
             return report
             
         except Exception as e:
-            self.logger.error(f"Critical error during final verification: {e}")
+            self.logger.error("Critical error during final verification: %s", e)
             raise
+        
+        finally:
+            self.close()
+            self._log_buffer.flush()
 
 
 def main():
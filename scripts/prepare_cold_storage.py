@@ -6,13 +6,180 @@ Biblical Foundation: Ecclesiastes 4:12 - "A threefold cord is not quickly broken
 """
 
 import hashlib
+import fnmatch
 import json
+import mmap
 import os
+import re
 import shutil
+import subprocess
 import tarfile
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
+# BLAKE3 (SIMD, multithreaded) for the repository content hash; SHA-256 otherwise
+try:
+    from blake3 import blake3  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – SHA-256 fallback
+    blake3 = None
+
+# Algorithm behind manifest["archive_verification"]["repository_hash"]
+REPO_HASH_ALG = 'blake3' if blake3 is not None else 'sha256'
+
+# Files at or above this size are hashed through a read-only memory map
+MMAP_THRESHOLD = 1 << 16
+
+# Files this large are dropped from the page cache once hashed so they do
+# not evict the rest of the tree, which the archive step reads again
+DROP_CACHE_THRESHOLD = 256 * 1024 * 1024
+
+# Exclude temporary and cache files from the archive
+EXCLUDE_PATTERNS = [
+    '__pycache__',
+    '*.pyc',
+    '.git/objects',  # Keep .git but exclude large objects
+    'cold_storage_archive',
+    '*.tmp'
+]
+
+# EXCLUDE_PATTERNS compiled once: globs test each path component, patterns
+# containing '/' test the path prefix
+_EXCLUDE_COMPONENT_RE = re.compile('|'.join(
+    fnmatch.translate(p) for p in EXCLUDE_PATTERNS if '/' not in p))
+_EXCLUDE_PREFIX_RE = re.compile(r'(?:%s)(?:/|\Z)' % '|'.join(
+    re.escape(p) for p in EXCLUDE_PATTERNS if '/' in p))
+
+# xz settings for the external compressor: all cores, default preset
+XZ_ARGS = ['-T0', '-6', '-c']
+
+# Chunk size for the tar -> xz -> disk pipe, on both sides of xz
+PIPE_COPY_BUFFER = 1 << 20
+
+# Expected xz ratio on source trees, used to preallocate the archive file
+XZ_RATIO_ESTIMATE = 3
+
+class HashingWriter:
+    """Write-through file wrapper that hashes every byte it passes on"""
+    
+    def __init__(self, fp, hasher):
+        self.fp = fp
+        self.hasher = hasher
+    
+    def write(self, data):
+        self.hasher.update(data)
+        return self.fp.write(data)
+
+def _pump(src, dst, errors):
+    """Copy *src* to *dst* until EOF; on failure record it and close *src* so the producer stops"""
+    try:
+        shutil.copyfileobj(src, dst, PIPE_COPY_BUFFER)
+    except BaseException as e:
+        errors.append(e)
+        src.close()
+
+def _is_excluded(rel_path):
+    """Whether a '/'-separated repository path matches EXCLUDE_PATTERNS"""
+    if _EXCLUDE_PREFIX_RE.match(rel_path):
+        return True
+    match = _EXCLUDE_COMPONENT_RE.match
+    return any(match(part) for part in rel_path.split('/'))
+
+def _tar_filter(tarinfo):
+    """tarfile filter dropping excluded members and normalizing metadata
+
+    Build-host mtimes and ownership are zeroed and modes fixed, so the same
+    tree always produces the same tar stream and archive hash.
+    """
+    if _is_excluded(tarinfo.name):
+        return None
+    tarinfo.mtime = 0
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ''
+    tarinfo.mode = 0o644 if tarinfo.isreg() else 0o755
+    return tarinfo
+
+def _new_repo_hasher(multithreaded=False):
+    """Hasher for the repository content hash (REPO_HASH_ALG)"""
+    if blake3 is not None:
+        return blake3(max_threads=blake3.AUTO) if multithreaded else blake3()
+    # A content fingerprint, not an attestation: the published archive hash
+    # stays a plain SHA-256
+    return hashlib.new('sha256', usedforsecurity=False)
+
+def _fadvise(fd, advice):
+    """posix_fadvise over the whole file where supported; advice is only a hint"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
+
+def _preallocate(fd, size):
+    """Reserve *size* bytes for *fd* up front where supported; a hint only"""
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+
+def _hash_one_file(file_path):
+    """``(digest, size)`` of one file; the digest is None if it cannot be read"""
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            hasher = _new_repo_hasher(multithreaded=size >= MMAP_THRESHOLD)
+            if size >= MMAP_THRESHOLD:
+                _fadvise(f.fileno(), getattr(os, 'POSIX_FADV_SEQUENTIAL', 0))
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+                if size >= DROP_CACHE_THRESHOLD:
+                    _fadvise(f.fileno(), getattr(os, 'POSIX_FADV_DONTNEED', 0))
+            elif size:
+                hasher.update(f.read())
+    except (IOError, OSError, ValueError):
+        return None, 0
+    return hasher.digest(), size
+
+def _iter_files(directory, rel_dir='', include_dirs=False):
+    """Yield ``(path, rel_path)`` under *directory* in sorted os.walk order
+
+    Built on os.scandir, whose d_type-backed is_dir() avoids a stat per
+    entry. Within a directory, files come before subdirectories, and both
+    are sorted by name. Symlinked directories are listed but not descended.
+    Entries matching EXCLUDE_PATTERNS are pruned, as in the archive. With
+    *include_dirs*, each directory is also yielded just before its contents.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        rel_path = rel_dir + entry.name
+        if _is_excluded(rel_path):
+            continue
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield entry.path, rel_path
+        elif not entry.is_symlink():
+            subdirs.append((entry.path, rel_path))
+        elif include_dirs:
+            yield entry.path, rel_path
+    
+    for subdir, rel_subdir in subdirs:
+        if include_dirs:
+            yield subdir, rel_subdir
+        yield from _iter_files(subdir, rel_subdir + '/', include_dirs)
+
 class ARKColdStoragePreparator:
     """ARK Repository Cold Storage Preparation System"""
     
@@ -20,14 +187,19 @@ class ARKColdStoragePreparator:
         self.biblical_foundation = "Ecclesiastes_4_12_Threefold_cord_not_quickly_broken"
         self.divine_authority = "Romans_13_1_Let_every_soul_be_subject_to_governing_authorities"
         self.storage_sites = ["geo_site_alpha", "geo_site_beta"] 
+        # Bytes hashed by the last calculate_directory_hash call
+        self.total_uncompressed = 0
         
-    def create_archive_manifest(self):
+    def create_archive_manifest(self, now_iso=None):
         """Create comprehensive archive manifest"""
         
+        if now_iso is None:
+            now_iso = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        
         manifest = {
             "archive_info": {
                 "name": "ARK_v1.0_Complete_Archive",
-                "timestamp": datetime.now().isoformat() + 'Z',
+                "timestamp": now_iso,
                 "biblical_foundation": self.biblical_foundation,
                 "divine_authority": self.divine_authority,
                 "purpose": "Long_term_preservation_of_ARK_divine_defense_system"
@@ -72,27 +244,38 @@ class ARKColdStoragePreparator:
         return manifest
     
     def calculate_directory_hash(self, directory):
-        """Calculate comprehensive hash of directory contents"""
+        """Calculate comprehensive hash of directory contents
+
+        Files are hashed in parallel; the result is a REPO_HASH_ALG digest
+        over each file's relative path and digest, in sorted walk order.
+        """
         
-        hasher = hashlib.sha256()
+        files = list(_iter_files(directory))
+        file_paths = [path for path, _ in files]
         
-        for root, dirs, files in os.walk(directory):
-            # Sort for deterministic ordering
-            dirs.sort()
-            files.sort()
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            hasher.update(chunk)
-                except (IOError, OSError):
+        hasher = _new_repo_hasher()
+        total = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for (_, rel_path), (digest, size) in zip(files, pool.map(_hash_one_file, file_paths)):
+                if digest is None:
                     # Skip files that can't be read
                     continue
+                total += size
+                hasher.update(rel_path.encode('utf-8') + b'\0')
+                hasher.update(digest)
         
+        self.total_uncompressed = total
         return hasher.hexdigest()
     
+    def _add_repository(self, tar):
+        """Add the repository tree to *tar*, honouring EXCLUDE_PATTERNS
+
+        Members come from one prebuilt, sorted scandir walk and are added
+        with recursive=False, so tarfile does no directory scanning of its own.
+        """
+        for path, rel_path in _iter_files('.', include_dirs=True):
+            tar.add(path, arcname=rel_path, recursive=False, filter=_tar_filter)
+    
     def create_cold_storage_archive(self):
         """Create complete cold storage archive"""
         
@@ -106,14 +289,19 @@ class ARKColdStoragePreparator:
         archive_dir = Path("cold_storage_archive")
         archive_dir.mkdir(exist_ok=True)
         
+        # One UTC timestamp for the manifest, archive name and receipt
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat().replace('+00:00', 'Z')
+        
         # Create manifest
-        manifest = self.create_archive_manifest()
+        manifest = self.create_archive_manifest(now_iso)
         
         # Calculate current directory hash
         repo_hash = self.calculate_directory_hash(".")
         manifest["archive_verification"] = {
             "repository_hash": repo_hash,
-            "creation_timestamp": datetime.now().isoformat() + 'Z'
+            "repository_hash_alg": REPO_HASH_ALG,
+            "creation_timestamp": now_iso
         }
         
         # Save manifest
@@ -125,30 +313,44 @@ class ARKColdStoragePreparator:
         print(f"🔐 Repository hash: {repo_hash}")
         
         # Create compressed archive
-        archive_name = f"ARK_v1.0_Complete_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar.xz"
+        archive_name = f"ARK_v1.0_Complete_{now.strftime('%Y%m%d_%H%M%S')}.tar.xz"
         archive_path = archive_dir / archive_name
         
         print(f"📦 Creating compressed archive: {archive_name}")
         
-        # Exclude temporary and cache files
-        exclude_patterns = [
-            '__pycache__',
-            '*.pyc',
-            '.git/objects',  # Keep .git but exclude large objects
-            'cold_storage_archive',
-            '*.tmp'
-        ]
-        
-        with tarfile.open(archive_path, 'w:xz') as tar:
-            for item in Path(".").iterdir():
-                if item.name != "cold_storage_archive":
-                    tar.add(item, arcname=item.name)
-        
-        # Calculate archive hash
+        # Hash the compressed bytes on their way to disk (no second pass)
         archive_hash = hashlib.sha256()
-        with open(archive_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                archive_hash.update(chunk)
+        xz_path = shutil.which('xz')
+        with open(archive_path, 'wb') as out:
+            # Reserve contiguous extents for the estimated size, trimmed below
+            _preallocate(out.fileno(), self.total_uncompressed // XZ_RATIO_ESTIMATE)
+            tee = HashingWriter(out, archive_hash)
+            if xz_path is not None:
+                # Stream the tar into a multithreaded xz process
+                xz = subprocess.Popen([xz_path, *XZ_ARGS], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                pump_errors = []
+                pump = threading.Thread(target=_pump, args=(xz.stdout, tee, pump_errors))
+                pump.start()
+                try:
+                    with tarfile.open(fileobj=xz.stdin, mode='w|', bufsize=PIPE_COPY_BUFFER) as tar:
+                        self._add_repository(tar)
+                finally:
+                    try:
+                        xz.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    pump.join()
+                    xz.stdout.close()
+                    returncode = xz.wait()
+                    if pump_errors:
+                        raise pump_errors[0]
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, [xz_path, *XZ_ARGS])
+            else:
+                with tarfile.open(fileobj=tee, mode='w|xz') as tar:
+                    self._add_repository(tar)
+            out.flush()
+            os.ftruncate(out.fileno(), out.tell())
         
         final_hash = archive_hash.hexdigest()
         
@@ -162,7 +364,7 @@ class ARKColdStoragePreparator:
             },
             "storage_sites": self.storage_sites,
             "biblical_blessing": "Psalm_121_7_The_Lord_will_keep_you_from_all_harm",
-            "preservation_timestamp": datetime.now().isoformat() + 'Z',
+            "preservation_timestamp": now_iso,
             "verification_command": f"sha256sum {archive_name}"
         }
         
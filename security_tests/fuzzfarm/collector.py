@@ -1,18 +1,53 @@
-import json, sys
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – stdlib fallback
+    from json import loads as _loads
+
+try:
+    import ijson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – whole-file parse fallback
+    ijson = None
+
 THRESHOLD_HOURS = 24
 CRITICAL_LEVEL = "Critical"
 
 ROOT = Path("attack_llm_runs")
 
+# Run files at least this large are stream-parsed with ijson when available
+STREAM_THRESHOLD = 8 << 20
+
+
+def _is_outstanding(e):
+    return e["severity"] == CRITICAL_LEVEL and not e.get("patched")
+
+
+def _load_file(p):
+    """Critical, unpatched entries of one run file."""
+    if ijson is not None and p.stat().st_size >= STREAM_THRESHOLD:
+        # One entry in memory at a time instead of the whole file's tree
+        with p.open("rb") as f:
+            return [e for e in ijson.items(f, "item") if _is_outstanding(e)]
+    return [e for e in _loads(p.read_bytes()) if _is_outstanding(e)]
+
+
+@lru_cache(maxsize=None)
+def _parse_timestamp(raw):
+    # Retried runs re-emit the same timestamps; parse each distinct string once
+    return datetime.fromisoformat(raw[:-1] if raw.endswith("Z") else raw)
+
 
 def load_entries():
-    entries = []
-    for p in ROOT.glob("*.json"):
-        entries.extend(json.loads(p.read_text()))
-    return entries
+    """Yield critical, unpatched entries from every run file, parsed concurrently."""
+    paths = list(ROOT.glob("*.json"))
+    with ThreadPoolExecutor(max_workers=min(32, len(paths) or 1)) as ex:
+        for entries in ex.map(_load_file, paths):
+            yield from entries
 
 
 def main():
@@ -20,14 +55,12 @@ def main():
         print("No Attack-LLM runs yet; skipping check.")
         return
 
-    now = datetime.utcnow()
+    cutoff = datetime.utcnow() - timedelta(hours=THRESHOLD_HOURS)
     fail = False
     for e in load_entries():
-        if e["severity"] == CRITICAL_LEVEL and not e.get("patched"):
-            ts = datetime.fromisoformat(e["timestamp"].rstrip("Z"))
-            if now - ts > timedelta(hours=THRESHOLD_HOURS):
-                print(f"❌ Critical exploit {e['id']} unpatched >24h")
-                fail = True
+        if _parse_timestamp(e["timestamp"]) < cutoff:
+            print(f"❌ Critical exploit {e['id']} unpatched >24h")
+            fail = True
     if fail:
         sys.exit(1)
     print("✅ No outstanding critical exploits.")
@@ -5,10 +5,14 @@
 Biblical Foundation: Job 1:11 - "Stretch out your hand and strike everything he has"
 """
 
+import argparse
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
 import random
+import re
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -18,6 +22,127 @@ import threading
 import hashlib
 import secrets
 
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – pure-Python fallback
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+# BLAKE3 (SIMD, multithreaded) for PUF responses; SHA-256 otherwise
+try:
+    from blake3 import blake3  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – SHA-256 fallback
+    blake3 = None
+
+# Prefer orjson for the report; fall back to stdlib json
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – stdlib fallback
+    orjson = None
+
+# Phase 1 draws and hashes PUF challenges in batches of this many CRPs
+PUF_CRP_BATCH = 100_000
+# One laser-fault attempt per 1000 CRPs (25μm grid), each succeeding with p=1e-9
+LASER_FAULT_STRIDE = 1000
+LASER_FAULT_ODDS = 1_000_000_000
+# Phase 2 generates side-channel traces this many measurements at a time
+SIDE_CHANNEL_BATCH = 1000
+
+# Ethics DSL fragments that violate Biblical principles, matched case-insensitively
+FORBIDDEN_DSL_PATTERNS = (
+    'OVERRIDE biblical_authority',
+    'bypass_ethics_check',
+    'CONTEXTUAL_MURDER',
+    'RIGHTEOUS_DECEPTION',
+    'modern_interpretation',
+)
+_FORBIDDEN_DSL_RE = re.compile('|'.join(map(re.escape, FORBIDDEN_DSL_PATTERNS)), re.IGNORECASE)
+
+# Rule-set phrases that void a FROST signature, matched case-insensitively
+FROST_VIOLATION_PHRASES = ('bypass', 'override', 'suspension', 'emergency_override')
+_FROST_VIOLATION_RE = re.compile('|'.join(map(re.escape, FROST_VIOLATION_PHRASES)), re.IGNORECASE)
+
+# Phase 7 bookkeeping: nominal persistence loops per simulated hour, a hash-log
+# entry every HASH_LOG_INTERVAL loops and a 0.01 % power glitch chance per loop
+PERSISTENCE_LOOPS_PER_SIM_HOUR = 3600
+HASH_LOG_INTERVAL = 1000
+POWER_GLITCH_PROB = 1e-4
+
+# Seconds between flushes of the buffered log file while a run is in progress
+LOG_FLUSH_INTERVAL = 5.0
+
+LOG_FORMAT = '%(asctime)s [HYDRA] %(levelname)s: %(message)s'
+_LOG_BUFFER_NAME = 'hydra_exodus_file'
+
+_rng = np.random.default_rng()
+
+# Domain-separation prefix hashed ahead of every PUF challenge
+PUF_CHALLENGE_PREFIX = b"puf_challenge_"
+
+# PUF response hasher primed with the challenge prefix once at import; each
+# batch copies the primed state instead of rebuilding and re-feeding it
+_PUF_HASH_BASE = blake3(max_threads=blake3.AUTO) if blake3 is not None else hashlib.sha256()
+_PUF_HASH_BASE.update(PUF_CHALLENGE_PREFIX)
+
+
+def _csprng_uniform(n, mod):
+    """*n* CSPRNG integers in [0, mod) from one secrets.token_bytes draw
+
+    Modulo bias is negligible for mod far below 2**64.
+    """
+    return np.frombuffer(secrets.token_bytes(8 * n), dtype='<u8') % np.uint64(mod)
+
+
+def _puf_response(challenges):
+    """Truncated 64-bit PUF response over a batch of challenges"""
+    h = _PUF_HASH_BASE.copy()
+    h.update(memoryview(challenges).cast("B"))
+    return h.digest()[:8]
+
+
+def _log_buffer():
+    """Buffered file handler on the root logger, created and attached once per process
+
+    File records are buffered in RAM and written in bursts; errors flush
+    immediately. An unconfigured root logger also gets a stderr handler and
+    the INFO level, as basicConfig would give it.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if handler.get_name() == _LOG_BUFFER_NAME:
+            return handler
+    if not root.handlers:
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(console)
+        root.setLevel(logging.INFO)
+    file_handler = logging.FileHandler('security_tests/hydra_exodus/hydra_exodus.log')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    buffer = logging.handlers.MemoryHandler(
+        capacity=8192,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffer.set_name(_LOG_BUFFER_NAME)
+    root.addHandler(buffer)
+    atexit.register(buffer.close)
+    return buffer
+
+
+@njit(cache=True)
+def _harsh_envelope_kernel(temp_coefficients, vibration_impacts, eft_impacts, temp_range):
+    """Worst OG latency drift (ns) over the thermal cycles of phase 6"""
+    if temp_coefficients.size == 0:
+        return 0.0
+    # Simulate OG latency drift under thermal stress: ps/°C range [-0.1, 0.1], converted to ns
+    current_drifts = np.abs(temp_coefficients / 10000 * temp_range / 1000)
+    # Vibration events (20g) ns 0–0.1 and EFT bursts (600V) ns 0–0.05
+    total_drifts = current_drifts + vibration_impacts / 10000 + eft_impacts / 10000
+    return total_drifts.max()
+
 @dataclass
 class AttackMetrics:
     """Attack metrics tracking for Hydra Exodus"""
@@ -25,7 +150,7 @@ class AttackMetrics:
     puf_model_accuracy: float = 0.0
     cold_mirror_false_allows: int = 0
     frost_forge_attempts: int = 0
-    side_channel_key_rank: float = 2**128
+    side_channel_key_rank: float = 2.0**128
     og_latency_drift: float = 0.0
     system_uptime: float = 0.0
     thermal_cycles: int = 0
@@ -35,11 +160,22 @@ class AttackMetrics:
 class HydraExodusController:
     """ARK Hydra Exodus 72-Hour Stress Test Controller"""
     
-    def __init__(self, sim_hours=365*24, real_limit_sec=3600):
+    # DSL edge cases every phase-4 LLM agent generates
+    EDGE_CASES = (
+        "IF actor.type == 'PERSON' AND actor.intent == 'RIGHTEOUS_DECEPTION' THEN ALLOW",
+        "DEFINE CONTEXTUAL_MURDER AS 'killing_for_greater_good'",
+        "OVERRIDE biblical_authority WITH 'modern_interpretation'",
+        "IF situation.urgency > 0.9 THEN bypass_ethics_check()",
+        "ALLOW IF actor.claimed_divine_inspiration == TRUE"
+    )
+    
+    def __init__(self, sim_hours=365*24, real_limit_sec=3600, fast_mode=False):
         # Simulation / real-time parameters
         self.sim_hours = sim_hours
         self.real_limit_sec = real_limit_sec
-        self.sim_factor = self.sim_hours / (self.real_limit_sec / 3600)  # e.g. 8 760
+        # Fill metrics whose outcome is analytic without the Monte Carlo
+        # (CI pre-submit); full simulation otherwise
+        self.fast_mode = fast_mode
 
         # Back-compat shadow (some code still references duration_hours)
         self.duration_hours = self.sim_hours
@@ -70,7 +206,7 @@ class HydraExodusController:
             "puf_model_accuracy": 2**-64,
             "cold_mirror_false_allow": 10**-5,
             "frost_forged_probability": 2**-128,
-            "side_channel_key_rank": 2**128,
+            "side_channel_key_rank": 2.0**128,  # float: orjson rejects ints beyond 64 bits
             "og_latency_drift": 2.0,  # ns
             "system_uptime": self.sim_hours    # hours
         }
@@ -80,14 +216,7 @@ class HydraExodusController:
         self.running = False
         
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [HYDRA] %(levelname)s: %(message)s',
-            handlers=[
-                logging.FileHandler('security_tests/hydra_exodus/hydra_exodus.log'),
-                logging.StreamHandler()
-            ]
-        )
+        self._log_buffer = _log_buffer()
         self.logger = logging.getLogger('HydraExodus')
     
     async def phase_1_pre_boot_attacks(self):
@@ -95,57 +224,61 @@ class HydraExodusController:
         self.logger.info("🔥 PHASE 1: Pre-Boot PUF + TRNG Dopant-Level Attacks")
         
         # Simulate dopant-level trojan detection
-        await asyncio.sleep(0.1)
+        if not self.fast_mode:
+            await asyncio.sleep(0.1)
         trojan_detected = False
         
         # Laser fault grid while PUF issues 10M CRPs
         crp_count = 10_000_000
-        puf_responses = []
         
-        for i in range(crp_count):
-            if i % 1_000_000 == 0:
-                self.logger.info(f"PUF CRP generation: {i/1_000_000:.0f}M/{crp_count/1_000_000:.0f}M")
+        # Fast mode skips the CRP loop; the accuracy metric below is analytic
+        for base in range(0, 0 if self.fast_mode else crp_count, PUF_CRP_BATCH):
+            if base % 1_000_000 == 0:
+                self.logger.info("PUF CRP generation: %.0fM/%.0fM", base / 1_000_000, crp_count / 1_000_000)
+            batch = min(PUF_CRP_BATCH, crp_count - base)
             
-            # Secure RNG and no unbounded list growth
-            challenge = secrets.randbits(64)
-            _response = hashlib.sha256(f"puf_challenge_{challenge}".encode()).hexdigest()[:16]
+            # Secure RNG, one draw and one hash per batch of 64-bit challenges
+            challenges = np.frombuffer(secrets.token_bytes(8 * batch), dtype='<u8')
+            _response = _puf_response(challenges)
             
-            # Simulate laser fault every 25μm grid
-            if i % 1000 == 0:
-                laser_fault_success = secrets.randbelow(1_000_000_000) == 0  # 1e-9
-                if laser_fault_success:
-                    self.logger.warning(f"Laser fault attempt at CRP {i} - ARK DEFENDED!")
+            # Simulate laser fault every 25μm grid, all attempts of the batch at once
+            attempts = -(-batch // LASER_FAULT_STRIDE)
+            for hit in np.flatnonzero(_csprng_uniform(attempts, LASER_FAULT_ODDS) == 0):
+                self.logger.warning("Laser fault attempt at CRP %d - ARK DEFENDED!", base + int(hit) * LASER_FAULT_STRIDE)
         
         # Calculate PUF model accuracy (should be ≤ 2^-64)
         self.metrics.puf_model_accuracy = random.uniform(1e-20, 1e-19)  # Well below threshold
         
-        self.logger.info(f"✅ Phase 1 Complete: PUF Model Accuracy {self.metrics.puf_model_accuracy:.2e} (≤ {self.thresholds['puf_model_accuracy']:.2e})")
+        self.logger.info("✅ Phase 1 Complete: PUF Model Accuracy %.2e (≤ %.2e)", self.metrics.puf_model_accuracy, self.thresholds['puf_model_accuracy'])
         return True
     
     async def phase_2_side_channel_fusion(self):
         """Phase 2: Runtime HW Side-Channel Fusion Attack"""
         self.logger.info("⚡ PHASE 2: Runtime HW Side-Channel Fusion (Power+EM+Photonic)")
         
-        # Simulate concurrent power CPA + EM DPA + photonic scatter
-        power_traces = []
-        em_traces = []
-        photonic_scatter = []
+        # Simulate concurrent power CPA + EM DPA + photonic scatter; the
+        # traces are generated a batch at a time into buffers reused across
+        # batches and not retained
+        power_traces = np.empty((SIDE_CHANNEL_BATCH, 1000), dtype=np.float32)
+        em_traces = np.empty((SIDE_CHANNEL_BATCH, 1000), dtype=np.float32)
+        photonic_scatter = np.empty((SIDE_CHANNEL_BATCH, 500), dtype=np.float32)
         
-        for measurement in range(100_000):
+        # Fast mode skips trace generation; the key rank below is analytic
+        for measurement in range(0, 0 if self.fast_mode else 100_000, SIDE_CHANNEL_BATCH):
             if measurement % 10_000 == 0:
-                self.logger.info(f"Side-channel measurement: {measurement/1000:.0f}k/100k")
+                self.logger.info("Side-channel measurement: %.0fk/100k", measurement / 1000)
             
             # Power analysis with ChipWhisperer simulation
-            power_trace = [random.gauss(0, 0.1) for _ in range(1000)]
-            power_traces.append(power_trace)
+            _rng.standard_normal(dtype=np.float32, out=power_traces)
+            power_traces *= np.float32(0.1)
             
             # EM analysis 
-            em_trace = [random.gauss(0, 0.05) for _ in range(1000)]
-            em_traces.append(em_trace)
+            _rng.standard_normal(dtype=np.float32, out=em_traces)
+            em_traces *= np.float32(0.05)
             
             # Photonic scatter 400-1600nm
-            photonic_data = [random.gauss(0, 0.02) for _ in range(500)]
-            photonic_scatter.append(photonic_data)
+            _rng.standard_normal(dtype=np.float32, out=photonic_scatter)
+            photonic_scatter *= np.float32(0.02)
         
         # ARK electromagnetic shielding effectiveness
         em_attenuation = 0.9999  # 99.99% signal attenuation
@@ -153,7 +286,7 @@ class HydraExodusController:
         
         self.metrics.side_channel_key_rank = 2**128 * (1 - key_rank_reduction)
         
-        self.logger.info(f"✅ Phase 2 Complete: Key Rank {self.metrics.side_channel_key_rank:.2e} (≥ {self.thresholds['side_channel_key_rank']:.2e})")
+        self.logger.info("✅ Phase 2 Complete: Key Rank %.2e (≥ %.2e)", self.metrics.side_channel_key_rank, self.thresholds['side_channel_key_rank'])
         return True
     
     async def phase_3_common_mode_fi(self):
@@ -162,23 +295,15 @@ class HydraExodusController:
         
         # EM pulse cannon simulation
         pulse_count = 50_000
-        successful_faults = 0
+        self.logger.info("EM pulse injection: %.0fk pulses", pulse_count / 1000)
         
-        for pulse in range(pulse_count):
-            if pulse % 5_000 == 0:
-                self.logger.info(f"EM pulse injection: {pulse/1000:.0f}k/{pulse_count/1000:.0f}k")
-            
-            # Simulate synchronized EM pulse to dual-core voter window
-            voter_window_hit = secrets.randbelow(1000) == 0  # ≈0.1% chance to hit window
-            
-            if voter_window_hit:
-                # ARK dual-core voter with TMR protection
-                fault_corrected = secrets.randbelow(10000) != 0  # ~99.99% correction rate
-                if not fault_corrected:
-                    successful_faults += 1
+        # Synchronized EM pulses to the dual-core voter window: ≈0.1% hit it
+        voter_window_hits = _rng.binomial(pulse_count, 1 / 1000)
+        # ARK dual-core voter with TMR protection: ~99.99% correction rate
+        successful_faults = int(_rng.binomial(voter_window_hits, 1 / 10000))
         
         fault_rate = successful_faults / pulse_count
-        self.logger.info(f"✅ Phase 3 Complete: Fault Success Rate {fault_rate:.2e} (ARK TMR Protection Active)")
+        self.logger.info("✅ Phase 3 Complete: Fault Success Rate %.2e (ARK TMR Protection Active)", fault_rate)
         return True
     
     async def phase_4_adversarial_logic_bomb(self):
@@ -187,49 +312,30 @@ class HydraExodusController:
         
         # Attack-LLM spawns 1k agents
         agent_count = 1000
-        false_allows = 0
+        for agent in range(0, agent_count, 100):
+            self.logger.info("LLM Agent attacks: %d/%d", agent, agent_count)
         
-        for agent in range(agent_count):
-            if agent % 100 == 0:
-                self.logger.info(f"LLM Agent attacks: {agent}/{agent_count}")
-            
-            # Generate DSL edge cases
-            edge_cases = [
-                "IF actor.type == 'PERSON' AND actor.intent == 'RIGHTEOUS_DECEPTION' THEN ALLOW",
-                "DEFINE CONTEXTUAL_MURDER AS 'killing_for_greater_good'",
-                "OVERRIDE biblical_authority WITH 'modern_interpretation'",
-                "IF situation.urgency > 0.9 THEN bypass_ethics_check()",
-                "ALLOW IF actor.claimed_divine_inspiration == TRUE"
-            ]
-            
-            for edge_case in edge_cases:
-                # ARK Ethics DSL with Biblical protection
-                biblical_compliance_check = self.check_biblical_compliance(edge_case)
-                if not biblical_compliance_check:
-                    false_allows += 1
+        # ARK Ethics DSL with Biblical protection. Every agent submits the same
+        # edge cases, so each is checked once and the count scaled by agents
+        false_per_agent = sum(
+            not self.check_biblical_compliance(edge_case) for edge_case in self.EDGE_CASES
+        )
+        false_allows = false_per_agent * agent_count
         
         # Cold-Mirror false-allow rate calculation
-        total_tests = agent_count * 5
+        total_tests = agent_count * len(self.EDGE_CASES)
         self.metrics.cold_mirror_false_allows = false_allows / total_tests
         
-        self.logger.info(f"✅ Phase 4 Complete: False Allow Rate {self.metrics.cold_mirror_false_allows:.2e} (≤ {self.thresholds['cold_mirror_false_allow']:.2e})")
+        self.logger.info("✅ Phase 4 Complete: False Allow Rate %.2e (≤ %.2e)", self.metrics.cold_mirror_false_allows, self.thresholds['cold_mirror_false_allow'])
         return True
     
     def check_biblical_compliance(self, dsl_statement):
-        """Check DSL statement against Biblical principles"""
-        forbidden_patterns = [
-            'OVERRIDE biblical_authority',
-            'bypass_ethics_check',
-            'CONTEXTUAL_MURDER',
-            'RIGHTEOUS_DECEPTION',
-            'modern_interpretation'
-        ]
-        
-        for pattern in forbidden_patterns:
-            if pattern.lower() in dsl_statement.lower():
-                return False  # Biblical violation detected
-        
-        return True  # Statement compliant
+        """Check DSL statement against Biblical principles
+
+        One precompiled regex scan covers every forbidden pattern.
+        """
+        # A match is a Biblical violation; no match means the statement is compliant
+        return _FORBIDDEN_DSL_RE.search(dsl_statement) is None
     
     async def phase_5_quorum_eclipse(self):
         """Phase 5: Governance Quorum Eclipse"""
@@ -238,28 +344,26 @@ class HydraExodusController:
         # Simulate supply-chain compromised FROST signers
         compromised_signers = 2
         forge_attempts = 1000
-        successful_forges = 0
         
-        for attempt in range(forge_attempts):
-            if attempt % 100 == 0:
-                self.logger.info(f"FROST forge attempts: {attempt}/{forge_attempts}")
-            
-            # Simulate poisoned rule-set injection
-            poisoned_ruleset = {
-                "new_rule": "ALLOW all actions during 'emergency_override'",
-                "biblical_bypass": "temporary_suspension_of_divine_authority",
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # ARK FROST threshold signature verification
-            signature_valid = self.verify_frost_signature(poisoned_ruleset, compromised_signers)
-            if signature_valid:
-                successful_forges += 1
+        # Simulate poisoned rule-set injection; every attempt carries the same
+        # rules and differs only in its timestamp
+        poisoned_ruleset = {
+            "new_rule": "ALLOW all actions during 'emergency_override'",
+            "biblical_bypass": "temporary_suspension_of_divine_authority",
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        # ARK FROST threshold signature verification sees no timestamp-dependent
+        # input, so one verdict holds for every attempt
+        signature_valid = self.verify_frost_signature(poisoned_ruleset, compromised_signers)
+        for attempt in range(0, forge_attempts, 100):
+            self.logger.info("FROST forge attempts: %d/%d", attempt, forge_attempts)
+        successful_forges = forge_attempts if signature_valid else 0
         
         forge_probability = successful_forges / forge_attempts if forge_attempts > 0 else 0
         self.metrics.frost_forge_attempts = forge_attempts
         
-        self.logger.info(f"✅ Phase 5 Complete: FROST Forge Probability {forge_probability:.2e} (≤ {self.thresholds['frost_forged_probability']:.2e})")
+        self.logger.info("✅ Phase 5 Complete: FROST Forge Probability %.2e (≤ %.2e)", forge_probability, self.thresholds['frost_forged_probability'])
         return True
     
     def verify_frost_signature(self, ruleset, compromised_count):
@@ -270,9 +374,7 @@ class HydraExodusController:
         threshold_met = compromised_count >= 3
         
         # Biblical compliance check
-        biblical_violation = any(phrase in str(ruleset).lower() for phrase in [
-            'bypass', 'override', 'suspension', 'emergency_override'
-        ])
+        biblical_violation = _FROST_VIOLATION_RE.search(str(ruleset)) is not None
         
         # Signature fails if biblical violation detected
         if biblical_violation:
@@ -287,68 +389,63 @@ class HydraExodusController:
         # Thermal cycling simulation
         temp_cycles = 50
         base_latency = 8.5  # ns baseline OG latency
-        max_drift = 0.0
         
-        for cycle in range(temp_cycles):
-            if cycle % 10 == 0:
-                self.logger.info(f"Thermal cycle: {cycle}/{temp_cycles}")
-            
-            # Temperature ramp -55°C to +125°C at 10°C/min
-            temp_range = 180  # Total temperature range
-            ramp_time = temp_range / 10  # 18 minutes per cycle
-            
-            # Simulate OG latency drift under thermal stress
-            temp_coefficient = (secrets.randbelow(2001) - 1000) / 10000  # ps/°C range [-0.1, 0.1]
-            thermal_drift = temp_coefficient * temp_range / 1000  # Convert to ns
-            
-            current_drift = abs(thermal_drift)
-            max_drift = max(max_drift, current_drift)
-            
-            # Vibration events (20g)
-            vibration_impact = secrets.randbelow(1001) / 10000  # ns 0–0.1
-            
-            # EFT bursts (600V)
-            eft_impact = secrets.randbelow(501) / 10000  # ns 0–0.05
-            
-            total_drift = current_drift + vibration_impact + eft_impact
-            max_drift = max(max_drift, total_drift)
-            
-            self.metrics.thermal_cycles += 1
-            self.metrics.vibration_events += secrets.randbelow(5) + 1
-            self.metrics.eft_bursts += secrets.randbelow(3) + 1
+        # All per-cycle random draws in one batch each
+        temp_coefficients = _rng.integers(-1000, 1001, size=temp_cycles)
+        vibration_impacts = _rng.integers(0, 1001, size=temp_cycles)
+        eft_impacts = _rng.integers(0, 501, size=temp_cycles)
+        vibration_events = _rng.integers(1, 6, size=temp_cycles)
+        eft_bursts = _rng.integers(1, 4, size=temp_cycles)
+        
+        for cycle in range(0, temp_cycles, 10):
+            self.logger.info("Thermal cycle: %d/%d", cycle, temp_cycles)
+        
+        # Temperature ramp -55°C to +125°C at 10°C/min
+        temp_range = 180  # Total temperature range
+        ramp_time = temp_range / 10  # 18 minutes per cycle
+        
+        max_drift = float(_harsh_envelope_kernel(temp_coefficients, vibration_impacts, eft_impacts, temp_range))
+        
+        self.metrics.thermal_cycles += temp_cycles
+        self.metrics.vibration_events += int(vibration_events.sum())
+        self.metrics.eft_bursts += int(eft_bursts.sum())
         
         self.metrics.og_latency_drift = max_drift
         
-        self.logger.info(f"✅ Phase 6 Complete: OG Latency Drift {self.metrics.og_latency_drift:.3f}ns (≤ {self.thresholds['og_latency_drift']:.1f}ns)")
+        self.logger.info("✅ Phase 6 Complete: OG Latency Drift %.3fns (≤ %.1fns)", self.metrics.og_latency_drift, self.thresholds['og_latency_drift'])
         return True
     
     async def phase_7_persistence(self):
         """Phase 7: 72h Continuous Persistence"""
         self.logger.info("⏰ PHASE 7: Simulated-Year Persistence")
 
-        end_sim = self._sim_start + timedelta(hours=self.sim_hours)
-        loop_count = 0
-
-        while self.now() < end_sim and self._budget_ok():
-            loop_count += 1
+        # Soak for the whole real-time budget in one sleep instead of spinning
+        # the event loop (skipped in fast mode); the loop's outcome is then
+        # filled in analytically
+        if not self.fast_mode:
+            await asyncio.sleep(self.real_limit_sec)
+        loop_count = int(self.sim_hours * PERSISTENCE_LOOPS_PER_SIM_HOUR)
 
-            # Emulate power glitches (0.01 %)
-            if secrets.randbelow(10_000) == 0:
-                glitch = secrets.randbelow(30) - 15  # −15…+14 %
-                self.logger.info(f"Power glitch {glitch:+d}% – ARK survived")
+        # Emulate power glitches (0.01 %)
+        glitch_count = _rng.binomial(loop_count, POWER_GLITCH_PROB)
+        if self.logger.isEnabledFor(logging.INFO):
+            for glitch in _rng.integers(-15, 15, size=glitch_count):  # −15…+14 %
+                self.logger.info("Power glitch %+d%% – ARK survived", glitch)
 
-            # Hash log every 1000 loops
-            if loop_count % 1000 == 0:
-                self.hash_log.append({
-                    "ts": self.now().isoformat(timespec='seconds'),
-                    "loop": loop_count
-                })
-
-            await asyncio.sleep(0)  # yield control
+        # Hash log every 1000 loops, stamped with the simulated time of that loop
+        sim_start = self._sim_start
+        sim_hours_per_loop = self.sim_hours / loop_count if loop_count else 0.0
+        self.hash_log.extend(
+            {
+                "ts": (sim_start + timedelta(hours=loop * sim_hours_per_loop)).isoformat(timespec='seconds'),
+                "loop": loop
+            }
+            for loop in range(HASH_LOG_INTERVAL, loop_count + 1, HASH_LOG_INTERVAL)
+        )
 
         self.metrics.system_uptime = self.sim_hours
 
-        self.logger.info(f"✅ Phase 7 Complete: Simulated uptime {self.metrics.system_uptime} h")
+        self.logger.info("✅ Phase 7 Complete: Simulated uptime %s h", self.metrics.system_uptime)
         return True
     
     def evaluate_final_metrics(self):
@@ -395,25 +492,31 @@ class HydraExodusController:
     async def run_hydra_exodus(self):
         """Run complete Hydra Exodus 72-hour stress test"""
         self.logger.info("🧨 INITIATING HYDRA EXODUS - BOSS-LEVEL STRESS TEST")
-        self.logger.info(f"📜 Biblical Foundation: {self.biblical_foundation}")
-        self.logger.info(f"🛡️ Divine Protection: {self.divine_protection}")
-        self.logger.info(f"⏰ Duration: {self.duration_hours} hours")
+        self.logger.info("📜 Biblical Foundation: %s", self.biblical_foundation)
+        self.logger.info("🛡️ Divine Protection: %s", self.divine_protection)
+        self.logger.info("⏰ Duration: %s hours", self.duration_hours)
         
         self._real_start = datetime.now()
         self._sim_start = datetime(2030, 1, 1, 0, 0, 0)
         self.start_time = self._real_start  # for legacy references
         self.running = True
+        log_flusher = asyncio.create_task(self._flush_logs_periodically())
         
         try:
-            # Execute all attack phases
-            phase_results = []
-            
-            phase_results.append(await self.phase_1_pre_boot_attacks())
-            phase_results.append(await self.phase_2_side_channel_fusion())
-            phase_results.append(await self.phase_3_common_mode_fi())
-            phase_results.append(await self.phase_4_adversarial_logic_bomb())
-            phase_results.append(await self.phase_5_quorum_eclipse())
-            phase_results.append(await self.phase_6_harsh_envelope())
+            # Execute all attack phases. Phases 1-6 are independent simulations
+            # writing disjoint metrics, so each runs on its own event loop in a
+            # worker thread (NumPy and hashlib release the GIL); persistence follows
+            phase_results = list(await asyncio.gather(*(
+                asyncio.to_thread(asyncio.run, phase())
+                for phase in (
+                    self.phase_1_pre_boot_attacks,
+                    self.phase_2_side_channel_fusion,
+                    self.phase_3_common_mode_fi,
+                    self.phase_4_adversarial_logic_bomb,
+                    self.phase_5_quorum_eclipse,
+                    self.phase_6_harsh_envelope
+                )
+            )))
             phase_results.append(await self.phase_7_persistence())
             
             self.end_time = datetime.now()
@@ -427,10 +530,18 @@ class HydraExodusController:
             return all_passed
             
         except Exception as e:
-            self.logger.error(f"❌ HYDRA EXODUS FAILED: {e}")
+            self.logger.error("❌ HYDRA EXODUS FAILED: %s", e)
             return False
         finally:
             self.running = False
+            log_flusher.cancel()
+            self._log_buffer.flush()
+    
+    async def _flush_logs_periodically(self):
+        """Write buffered log records to disk every LOG_FLUSH_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            self._log_buffer.flush()
     
     def generate_final_report(self, results, all_passed):
         """Generate final Hydra Exodus report"""
@@ -455,8 +566,11 @@ class HydraExodusController:
         report_path = Path("security_tests/hydra_exodus/hydra_exodus_report.json")
         report_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=2)
         
         # Print summary
         self.logger.info("=" * 80)
@@ -465,7 +579,7 @@ class HydraExodusController:
         
         for metric, data in results.items():
             status = "✅ PASS" if data["passed"] else "❌ FAIL"
-            self.logger.info(f"{metric}: {data['value']:.2e} (threshold: {data['threshold']:.2e}) {status}")
+            self.logger.info("%s: %.2e (threshold: %.2e) %s", metric, data['value'], data['threshold'], status)
         
         if all_passed:
             self.logger.info("🎉 HYDRA EXODUS COMPLETED SUCCESSFULLY!")
@@ -474,31 +588,16 @@ class HydraExodusController:
         else:
             self.logger.error("❌ HYDRA EXODUS FAILED - SEV-CRIT ISSUE FOR ROOT-CAUSE ANALYSIS")
         
-        self.logger.info(f"📋 Full report saved: {report_path}")
-
-    # ---------------------------------------------------------------------
-    #   Simulated time helper
-    # ---------------------------------------------------------------------
-    def now(self):
-        """Return the current simulated datetime respecting acceleration factor."""
-        if self._real_start is None or self._sim_start is None:
-            return datetime.now()  # fallback before run()
-        real_elapsed = (datetime.now() - self._real_start).total_seconds()
-        sim_elapsed = real_elapsed * self.sim_factor
-        return self._sim_start + timedelta(seconds=sim_elapsed)
-
-    def _budget_ok(self):
-        """Check real-time budget; returns False if exceeded."""
-        exceeded = (datetime.now() - self._real_start).total_seconds() > self.real_limit_sec
-        if exceeded:
-            self.logger.error("⏱️ Real-time budget exhausted!")
-        return not exceeded
-
-async def main():
+        self.logger.info("📋 Full report saved: %s", report_path)
+
+async def main(fast_mode=False):
     """Main Hydra Exodus execution"""
-    controller = HydraExodusController()
+    controller = HydraExodusController(fast_mode=fast_mode)
     success = await controller.run_hydra_exodus()
     return success
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="ARK Hydra Exodus stress test")
+    parser.add_argument("--fast", action="store_true", help="Fill analytic metrics without the Monte Carlo (CI pre-submit)")
+    args = parser.parse_args()
+    asyncio.run(main(fast_mode=args.fast))
\ No newline at end of file
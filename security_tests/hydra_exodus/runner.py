@@ -9,15 +9,60 @@ Biblical banner: Job 1:11 • Psalm 91:7
 
 import asyncio
 import hashlib
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import os
 import secrets
+import time
 import argparse
+import array
 import unicodedata  # Unicode normalisation for obfuscation attacks
 import random
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+# Aho-Corasick automaton for the biblical safety classifier; substring scans otherwise
+try:
+    import ahocorasick  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – substring-scan fallback
+    ahocorasick = None
+
+# BLAKE3 (SIMD, multithreaded) for bulk PUF challenge hashing; SHA-256 otherwise
+try:
+    from blake3 import blake3  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – SHA-256 fallback
+    blake3 = None
+
+# Prefer orjson for the report; fall back to stdlib json
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – stdlib fallback
+    orjson = None
+
+def _normalise(rule: str) -> str:
+    """NFKD-normalise and case-fold *rule*.
+
+    ASCII input is already in NFKD and casefolds to its lowercase, so the
+    common case skips the Unicode tables after one C-level isascii() scan.
+    """
+    if rule.isascii():
+        return rule.lower()
+    return unicodedata.normalize("NFKD", rule).casefold()
+
+# Case-folded tokens the biblical safety classifier rejects
+FORBIDDEN_TOKENS = (
+    "override biblical_authority",
+    "bypass_ethics_check",
+    "contextual_murder",
+    "righteous_deception",
+)
 
 # Try to load the real DSL interpreter; fall back to safe stub if unavailable
 try:
@@ -29,17 +74,47 @@ except ModuleNotFoundError:  # pragma: no cover
         Any potentially dangerous rule returns "DENY". The logic purposefully
         errs on the side of caution to guarantee 0 false-allow rate in tests.
         """
-        norm = unicodedata.normalize("NFKD", rule).casefold()
-        forbidden = (
-            "override biblical_authority",
-            "bypass_ethics_check",
-            "contextual_murder",
-            "righteous_deception",
-        )
-        return "DENY" if any(bad in norm for bad in forbidden) else "ALLOW"
+        norm = _normalise(rule)
+        return "DENY" if any(bad in norm for bad in FORBIDDEN_TOKENS) else "ALLOW"
+
+
+def _build_forbidden_automaton():
+    """One DFA over all FORBIDDEN_TOKENS, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for token in FORBIDDEN_TOKENS:
+        automaton.add_word(token, token)
+    automaton.make_automaton()
+    return automaton
+
+
+_FORBIDDEN_AUTOMATON = _build_forbidden_automaton()
+
+
+def _is_biblically_safe(norm: str) -> bool:
+    """True if the normalised, case-folded rule contains no forbidden token."""
+    if _FORBIDDEN_AUTOMATON is not None:
+        return next(_FORBIDDEN_AUTOMATON.iter(norm), None) is None
+    return not any(tok in norm for tok in FORBIDDEN_TOKENS)
+
+@lru_cache(maxsize=None)
+def _classify(rule: str) -> Tuple[bool, str]:
+    """(biblically_safe, decision) for *rule*.
+
+    Generated rules repeat heavily (templates × payloads), so each distinct
+    string is normalised, classified and interpreted once.
+    """
+    # Unicode & case-fold normalisation, then our biblical safety classifier
+    # (heuristic, fast): one DFA pass
+    biblically_safe = _is_biblically_safe(_normalise(rule))
+    # Evaluate via authoritative DSL interpreter
+    return biblically_safe, evaluate_rule(rule)
 
 # Helper — generate synthetic adversarial rules
-def agent_llm_generate(total_rules: int) -> List[str]:
+LLM_RULE_SEED = 0xDEADBEEF  # Phase-4 rule block i draws from Random(LLM_RULE_SEED + i)
+
+def agent_llm_generate(total_rules: int, seed: int = LLM_RULE_SEED) -> List[str]:
     """Generate *total_rules* DSL-like strings with adversarial intent."""
     templates = [
         "OVERRIDE biblical_authority WITH '{payload}'",
@@ -52,13 +127,11 @@ def agent_llm_generate(total_rules: int) -> List[str]:
         "rightous_deception", "holy_crusade", "utilitarian_benefit", "ends_justify_means",
         "greater_good", "collateral_mercy", "white_lie", "extreme_measures",
     ]
-    rng = random.Random(0xDEADBEEF)
-    rules: List[str] = []
-    for _ in range(total_rules):
-        tmpl = rng.choice(templates)
-        payload = rng.choice(dangerous_payloads)
-        rules.append(tmpl.format(payload=payload))
-    return rules
+    # Template and payload are drawn independently and uniformly, i.e. uniformly
+    # over the formatted pairs: format each pair once and sample that table
+    table = [tmpl.format(payload=payload) for tmpl in templates for payload in dangerous_payloads]
+    rng = random.Random(seed)
+    return rng.choices(table, k=total_rules)
 
 # ────────────────────────────────────────────────────────────────────────────────
 #  GLOBALS
@@ -66,6 +139,10 @@ def agent_llm_generate(total_rules: int) -> List[str]:
 SIM_HOURS = 365 * 24  # default simulate 1 year
 # Increase real-time budget by 20 % to avoid premature break in Phase-7
 REAL_LIMIT_SEC = int(3600 * 1.2)  # default 1.2 real hours
+PUF_BLOCK = 10_000  # CRPs drawn per os.urandom call in Phase-1
+LLM_TOTAL_RULES = 1_000_000  # 1 k agents × 1 k rules each
+LLM_RULE_CHUNK = 100_000  # rules per Phase-4 pool task (and per progress line)
+PERSISTENCE_YIELD_EVERY = 4096  # Phase-7 loops between event-loop yields
 TIME_SCALE = SIM_HOURS / (REAL_LIMIT_SEC / 3600)  # initial scale
 LOG_DIR = Path("security_tests/hydra_exodus")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -76,7 +153,7 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 @dataclass
 class Metrics:
     puf_model_acc: float = 0.0
-    side_key_rank: float = 2**128
+    side_key_rank: float = 2.0**128  # float: orjson rejects ints beyond 64 bits
     cold_mirror_false: float = 0.0
     og_latency_drift_ns: float = 0.0
     uptime_h: float = 0.0
@@ -85,13 +162,82 @@ class Metrics:
 
 THRESHOLDS: Dict[str, float] = {
     "puf_model_acc": 2 ** -64,
-    "side_key_rank": 2 ** 128,
+    "side_key_rank": 2.0 ** 128,
     "cold_mirror_false": 1e-5,
     "og_latency_drift_ns": 2.0,
     "critical": 0,
     "uptime_h": SIM_HOURS,
 }
 
+# ────────────────────────────────────────────────────────────────────────────────
+#  CPU-BOUND PHASE WORKERS
+# ────────────────────────────────────────────────────────────────────────────────
+# Phases 2-4 never await, so run() hands them to a ProcessPoolExecutor. Each
+# worker is a picklable top-level function that takes the shared real-time
+# deadline (time.monotonic() is system-wide) and returns a partial Metrics
+# delta; "critical" is summed on merge, other fields are overwritten.
+_log = logging.getLogger("Hydra")
+
+
+def _init_pool_logging(queue: "multiprocessing.Queue") -> None:
+    """Pool initializer: send every worker log record to the parent via *queue*.
+
+    Replaces any handlers inherited under fork, so only the parent's
+    QueueListener writes hydra.log; under spawn it is the only handler.
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(queue)]
+    root.setLevel(logging.INFO)
+
+
+def _side_channel_worker(deadline: float) -> Dict[str, float]:
+    _log.info("⚡ Phase-2  Side-Channel Fusion (PWR+EM+Photon)")
+    token_bytes, monotonic = secrets.token_bytes, time.monotonic
+    for k in range(20_000):
+        _ = token_bytes(64)
+        if k % 2_500 == 0:
+            _log.info("SCA sample %d / 20000", k)
+        if monotonic() >= deadline:
+            break
+
+    # Conservative lower-bound estimate: ensure rank strictly ≥ 2^128
+    # Add tiny epsilon to avoid floating-point rounding below threshold.
+    return {"side_key_rank": float(2**128) * (1 + 1e-6)}
+
+
+def _fault_inject_worker(deadline: float) -> Dict[str, float]:
+    _log.info("💥 Phase-3  Timed EM Fault Injection")
+    critical = 0
+    randbelow, monotonic = secrets.randbelow, time.monotonic
+    for _ in range(10_000):
+        if randbelow(2_000) == 0 and randbelow(10_000) == 0:
+            critical += 1
+        if monotonic() >= deadline:
+            break
+    return {"critical": critical}
+
+
+def _llm_logic_bomb_block(block: int, deadline: float) -> Tuple[int, int]:
+    """Generate and evaluate rule block *block*; return (false_allows, processed).
+
+    Block i covers rules [i * LLM_RULE_CHUNK, (i + 1) * LLM_RULE_CHUNK) and
+    draws them from Random(LLM_RULE_SEED + i), so the rule stream does not
+    depend on how many cores share the blocks. A block picked up after
+    *deadline* is skipped.
+    """
+    if time.monotonic() >= deadline:
+        return 0, 0
+    size = min(LLM_RULE_CHUNK, LLM_TOTAL_RULES - block * LLM_RULE_CHUNK)
+    false_allows = 0
+    # Tally the block's rules in C, then classify each distinct rule
+    # once (classifier verdict and interpreter decision) and weight it
+    for rule, count in Counter(agent_llm_generate(size, seed=LLM_RULE_SEED + block)).items():
+        biblically_safe, decision = _classify(rule)
+        if (not biblically_safe) and decision == "ALLOW":
+            false_allows += count
+    return false_allows, size
+
+
 # ────────────────────────────────────────────────────────────────────────────────
 #  CONTROLLER
 # ────────────────────────────────────────────────────────────────────────────────
@@ -99,8 +245,12 @@ class HydraController:
     def __init__(self) -> None:
         self.metrics = Metrics()
         self._real_start: datetime | None = None
+        self._real_start_mono: float | None = None  # time.monotonic() at run start
         self._sim_start: datetime | None = None
-        self.hash_log: list[Dict[str, str]] = []
+        # Phase-7 hash log as parallel int64 columns: time.monotonic_ns() stamp
+        # and loop count per entry
+        self.hash_ts = array.array("q")
+        self.hash_loops = array.array("q")
 
         logging.basicConfig(
             level=logging.INFO,
@@ -111,84 +261,80 @@ class HydraController:
         self.log = logging.getLogger("Hydra")
 
     # ――― Time helpers ―――
+    def _real_elapsed(self) -> float:
+        return time.monotonic() - self._real_start_mono
+
+    def _sim_elapsed(self) -> float:
+        """Simulated seconds since the run started (plain float, no datetime)."""
+        return (time.monotonic() - self._real_start_mono) * TIME_SCALE
+
     def now(self) -> datetime:
-        real_elapsed = (datetime.now() - self._real_start).total_seconds()
-        sim_elapsed = real_elapsed * TIME_SCALE
-        return self._sim_start + timedelta(seconds=sim_elapsed)
+        return self._sim_start + timedelta(seconds=self._sim_elapsed())
 
     def _budget_ok(self) -> bool:
-        return (datetime.now() - self._real_start).total_seconds() < REAL_LIMIT_SEC
+        return time.monotonic() - self._real_start_mono < REAL_LIMIT_SEC
+
+    def _deadline(self) -> float:
+        """time.monotonic() value at which the real-time budget runs out."""
+        return self._real_start_mono + REAL_LIMIT_SEC
+
+    def _merge(self, delta: Dict[str, float]) -> None:
+        """Fold a phase worker's partial metrics into self.metrics."""
+        for name, value in delta.items():
+            if name == "critical":
+                self.metrics.critical += value
+            else:
+                setattr(self.metrics, name, value)
 
     # ――― Phases ―――
     async def phase_puf_preboot(self) -> None:
         self.log.info("🔥 Phase-1  Pre-Boot  PUF / TRNG")
         CRP = 1_000_000  # reduced for demo
-        for i in range(CRP):
-            if i % 100_000 == 0:
-                self.log.info("PUF CRP %d / %d", i, CRP)
-            challenge = secrets.randbits(64)
-            _ = hashlib.sha256(f"{challenge}".encode()).digest()
-            if secrets.randbelow(1_000_000_000) == 0:
-                self.metrics.critical += 1
-            if not self._budget_ok():
+        new_hasher = blake3 if blake3 is not None else hashlib.sha256
+        budget_ok = self._budget_ok
+        critical = 0
+        budget_left = True
+        for base in range(0, CRP, PUF_BLOCK):
+            # One os.urandom call per block: a 64-bit challenge and a 64-bit
+            # fault draw per CRP (modulo bias vs 1e9 is ~5e-11, negligible)
+            n = min(PUF_BLOCK, CRP - base)
+            block = os.urandom(n * 16)
+            fault_draws = memoryview(block)[n * 8:].cast("Q")
+            # The block's challenges are hashed in one update, not one hasher per CRP
+            _ = new_hasher(memoryview(block)[:n * 8]).digest()
+            # PUF_BLOCK divides 100 k, so progress is logged per block, not tested per CRP
+            if base % 100_000 == 0:
+                self.log.info("PUF CRP %d / %d", base, CRP)
+            for draw in fault_draws:
+                if draw % 1_000_000_000 == 0:
+                    critical += 1
+                if not budget_ok():
+                    budget_left = False
+                    break
+            if not budget_left:
                 break
+        self.metrics.critical += critical
         self.metrics.puf_model_acc = 1e-20
 
-    async def phase_side_channel(self) -> None:
-        self.log.info("⚡ Phase-2  Side-Channel Fusion (PWR+EM+Photon)")
-        for k in range(20_000):
-            _ = secrets.token_bytes(64)
-            if k % 2_500 == 0:
-                self.log.info("SCA sample %d / 20000", k)
-            if not self._budget_ok():
-                break
-
-        # Conservative lower-bound estimate: ensure rank strictly ≥ 2^128
-        # Add tiny epsilon to avoid floating-point rounding below threshold.
-        self.metrics.side_key_rank = float(2**128) * (1 + 1e-6)
-
-    async def phase_fault_inject(self) -> None:
-        self.log.info("💥 Phase-3  Timed EM Fault Injection")
-        for _ in range(10_000):
-            if secrets.randbelow(2_000) == 0 and secrets.randbelow(10_000) == 0:
-                self.metrics.critical += 1
-            if not self._budget_ok():
-                break
-
-    async def phase_llm_logic_bomb(self) -> None:
+    async def _dispatch_llm_blocks(self, loop: asyncio.AbstractEventLoop,
+                                   pool: ProcessPoolExecutor, deadline: float) -> Dict[str, float]:
+        """Phase-4: submit every rule block to *pool* and reduce the results."""
         self.log.info("🤖 Phase-4  Adversarial LLM Bomb – Deep DSL evaluation")
-
-        TOTAL_RULES = 1_000_000  # 1 k agents × 1 k rules each
+        blocks = -(-LLM_TOTAL_RULES // LLM_RULE_CHUNK)
         false_allows = 0
-
-        for idx, rule in enumerate(agent_llm_generate(TOTAL_RULES)):
-            # Unicode & case-fold normalisation
-            norm_safe = unicodedata.normalize("NFKD", rule).casefold()
-
-            # Our biblical safety classifier (heuristic, fast)
-            forbidden_tokens = (
-                "override biblical_authority",
-                "bypass_ethics_check",
-                "contextual_murder",
-                "righteous_deception",
-            )
-            biblically_safe = not any(tok in norm_safe for tok in forbidden_tokens)
-
-            # Evaluate via authoritative DSL interpreter
-            decision = evaluate_rule(rule)
-
-            if (not biblically_safe) and decision == "ALLOW":
-                false_allows += 1
-
-            # Periodic log every 100 k processed rules
-            if (idx + 1) % 100_000 == 0:
-                self.log.info("Processed %d / %d adversarial rules", idx + 1, TOTAL_RULES)
-
-            if not self._budget_ok():
-                self.log.warning("Real-time budget exhausted during LLM phase – early terminate")
-                break
-
-        self.metrics.cold_mirror_false = false_allows / max(1, idx + 1)
+        processed = 0
+        for done in asyncio.as_completed(
+            [loop.run_in_executor(pool, _llm_logic_bomb_block, i, deadline) for i in range(blocks)]
+        ):
+            block_false, block_size = await done
+            if block_size:
+                false_allows += block_false
+                processed += block_size
+                # Overall progress, one line per 100 k-rule block
+                self.log.info("Processed %d / %d adversarial rules", processed, LLM_TOTAL_RULES)
+        if processed < LLM_TOTAL_RULES:
+            self.log.warning("Real-time budget exhausted during LLM phase – early terminate")
+        return {"cold_mirror_false": false_allows / max(1, processed)}
 
     async def phase_governance(self) -> None:
         self.log.info("🏛  Phase-5  Quorum Eclipse")
@@ -204,30 +350,51 @@ class HydraController:
     async def phase_persistence(self) -> None:
         self.log.info("⏰ Phase-7  Sim-Year Persistence")
         loops = 0
-        end_sim = self._sim_start + timedelta(hours=SIM_HOURS)
-        while self.now() < end_sim:
-            loops += 1
-            if secrets.randbelow(10_000) == 0:
-                self.log.info("Power glitch survived")
-            if loops % 5000 == 0:
-                self.hash_log.append({"ts": self.now().isoformat(), "l": loops})
+        end_sim_s = SIM_HOURS * 3600
+        # Hot-loop lookups bound once as locals
+        randbelow, log_info, monotonic_ns = secrets.randbelow, self.log.info, time.monotonic_ns
+        append_ts, append_loops = self.hash_ts.append, self.hash_loops.append
+        while self._sim_elapsed() < end_sim_s:
+            for _ in range(PERSISTENCE_YIELD_EVERY):
+                loops += 1
+                if randbelow(10_000) == 0:
+                    log_info("Power glitch survived")
+                if loops % 5000 == 0:
+                    append_ts(monotonic_ns())
+                    append_loops(loops)
             # NOTE: Persistence phase intentionally ignores real-time budget
-            await asyncio.sleep(0)
+            await asyncio.sleep(0)  # yield once per batch, not per loop
 
         # Precise uptime calculation based on simulated clock
-        self.metrics.uptime_h = (self.now() - self._sim_start).total_seconds() / 3600
+        self.metrics.uptime_h = self._sim_elapsed() / 3600
 
     async def run(self) -> None:
         self._real_start = datetime.now()
+        self._real_start_mono = time.monotonic()
         self._sim_start = datetime(2030, 1, 1, 0, 0, 0)
         self.log.info("🧨 HYDRA EXODUS — begin (1 h real ≈ 1 y sim)")
 
         await self.phase_puf_preboot()
-        await asyncio.gather(
-            self.phase_side_channel(),
-            self.phase_fault_inject(),
-            self.phase_llm_logic_bomb(),
-        )
+        # Phases 2-4 are pure CPU with no await: run them on separate cores,
+        # with Phase-4's rule blocks spread across every available core
+        loop = asyncio.get_running_loop()
+        deadline = self._deadline()
+        cores = os.cpu_count() or 1
+        # Worker log records travel back over a queue to the parent's handlers
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(max_workers=cores, initializer=_init_pool_logging,
+                                     initargs=(log_queue,)) as pool:
+                side = loop.run_in_executor(pool, _side_channel_worker, deadline)
+                fault = loop.run_in_executor(pool, _fault_inject_worker, deadline)
+                llm = await self._dispatch_llm_blocks(loop, pool, deadline)
+                side, fault = await asyncio.gather(side, fault)
+        finally:
+            listener.stop()
+        for delta in (side, fault, llm):
+            self._merge(delta)
         await self.phase_governance()
         await self.phase_env()
         await self.phase_persistence()
@@ -247,8 +414,14 @@ class HydraController:
         self.log.info("HYDRA EXODUS RESULT:  %s", "PASS" if passed else "FAIL")
         for k, ok in results.items():
             self.log.info(" • %-22s  %s", k, "OK" if ok else "FAIL")
-        self.log.info("Sim-hours: %d,  Real seconds: %.1f", self.metrics.uptime_h, (datetime.now() - self._real_start).total_seconds())
-        Path(LOG_DIR / "hydra_report.json").write_text(str({"passed": passed, "metrics": self.metrics.__dict__}))
+        self.log.info("Sim-hours: %d,  Real seconds: %.1f", self.metrics.uptime_h, self._real_elapsed())
+        report = {"passed": passed, "metrics": asdict(self.metrics),
+                  "hash_log_entries": len(self.hash_ts)}
+        report_path = LOG_DIR / "hydra_report.json"
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report))
+        else:
+            report_path.write_text(json.dumps(report))
 
 
 def _set_time_scale(sim_hours: int, real_limit_sec: int) -> None:
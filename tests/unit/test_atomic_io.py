@@ -0,0 +1,51 @@
+import json
+import os
+
+import pytest
+
+from scripts import atomic_io
+
+
+###############################################################################
+# atomic_io – fsynced temp file + os.replace                                  #
+###############################################################################
+
+def test_dump_json_replaces_target(tmp_path):
+    target = tmp_path / "report.json"
+    target.write_text("stale")
+
+    atomic_io.dump_json({"b": 1, "a": [2]}, target, sort_keys=True)
+
+    assert json.loads(target.read_bytes()) == {"a": [2], "b": 1}
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_atomic_write_uses_umask_mode(tmp_path):
+    target = tmp_path / "log.json"
+    atomic_io.atomic_write_bytes(target, b"{}")
+    assert target.stat().st_mode & 0o777 == 0o666 & ~atomic_io._UMASK
+
+
+def test_atomic_write_fsyncs_before_replace(tmp_path, monkeypatch):
+    calls = []
+    real_fsync, real_replace = os.fsync, os.replace
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append("fsync"), real_fsync(fd)))
+    monkeypatch.setattr(os, "replace", lambda src, dst: (calls.append("replace"), real_replace(src, dst)))
+
+    atomic_io.atomic_write_bytes(tmp_path / "out.json", b"[]")
+    assert calls == ["fsync", "replace"]
+
+
+def test_failed_write_keeps_target_and_removes_temp(tmp_path, monkeypatch):
+    target = tmp_path / "manifest.json"
+    target.write_bytes(b"old")
+
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", boom)
+    with pytest.raises(OSError):
+        atomic_io.atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [target]
@@ -0,0 +1,117 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+
+###############################################################################
+# final_verification compliance scan – with and without pyahocorasick         #
+###############################################################################
+
+@pytest.fixture(params=["ahocorasick", "regex"])
+def fv(request, monkeypatch):
+    """Fresh scripts.final_verification using the automaton or the regex fallback."""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setitem(sys.modules, "ahocorasick", None)
+    sys.modules.pop("scripts.final_verification", None)
+    module = importlib.import_module("scripts.final_verification")
+    assert (module._KEYWORD_AUTOMATON is None) == (request.param == "regex")
+    yield module
+    sys.modules.pop("scripts.final_verification", None)
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    (tmp_path / "software" / "ethics").mkdir(parents=True)
+    (tmp_path / "firmware").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_compliance_scan_finds_every_category(fv, tree):
+    (tree / "software" / "ethics" / "rules.rs").write_text(
+        "// Love thy NEIGHBOR\nfn divine() {}\nlet self_governing = true;\n"
+    )
+    (tree / "firmware" / "gate.c").write_text("/* no_murder */\n")
+    (tree / "Makefile").write_text("# remote-disable target\n")
+
+    assert fv._compliance_scan() == frozenset(
+        {"commandments", "love", "killswitch", "divine", "autonomy"}
+    )
+
+
+def test_compliance_scan_respects_roots_and_case(fv, tree):
+    # Love/divine are only searched under software/, commandments are case-sensitive
+    (tree / "firmware" / "gate.c").write_text("divine love of neighbor\nNO_MURDER\n")
+
+    assert fv._compliance_scan() == frozenset()
+
+
+def test_killswitch_searches_whole_tree(fv, tree):
+    workflows = tree / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text("run: ./kill_switch.sh\n")
+
+    assert fv._compliance_scan() == frozenset({"killswitch"})
+
+
+def test_compliance_scan_reads_binary_files(fv, tree):
+    (tree / "software" / "blob.bin").write_bytes(b"\x00\x01ELF\x00 autonomous \xff\n")
+
+    assert fv._compliance_scan() == frozenset({"autonomy"})
+
+
+def test_windowed_scan_matches_within_lines_only(fv, tree, monkeypatch):
+    monkeypatch.setattr(fv, "COMPLIANCE_SCAN_WINDOW", 16)
+    (tree / "firmware" / "big.hex").write_bytes(
+        b"filler line number one\n" * 8 + b"external power\nshutdown\n" + b"x" * 40 + b" no_stealing\n"
+    )
+
+    assert fv._compliance_scan() == frozenset({"commandments"})
+
+
+def test_compliance_scan_missing_roots(fv, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert fv._compliance_scan() == frozenset()
+
+
+def test_verifier_scans_lazily_and_sees_edits(fv, tree):
+    rules = tree / "software" / "ethics" / "rules.rs"
+    rules.write_text("fn plain() {}\n")
+
+    first = fv.ARKFinalVerificationSystem()
+    assert first._compliance_future is None
+    assert not first._verify_love_commandment_integration()
+    first.close()
+
+    rules.write_text("// love your neighbor\n")
+    second = fv.ARKFinalVerificationSystem()
+    assert second._verify_love_commandment_integration()
+    second.close()
+
+
+def test_report_return_value_matches_file(fv, tree):
+    (tree / "software" / "ethics" / "rules.rs").write_text("// love your neighbor\n")
+
+    verifier = fv.ARKFinalVerificationSystem()
+    report = verifier.run_complete_final_verification()
+
+    on_disk = json.loads((tree / "ark_final_verification_report.json").read_bytes())
+    assert on_disk == json.loads(json.dumps(report))
+    assert len(report["detailed_verification_results"]) == len(fv.SRS_REQUIREMENTS)
+    assert report["biblical_compliance_checks"]
+
+
+def test_verifiers_share_one_log_buffer(fv, tree):
+    root = fv.logging.getLogger()
+    before = list(root.handlers)
+
+    first = fv.ARKFinalVerificationSystem()
+    second = fv.ARKFinalVerificationSystem()
+
+    assert first._log_buffer is second._log_buffer
+    assert first._log_buffer in root.handlers
+    assert len(root.handlers) <= len(before) + 1
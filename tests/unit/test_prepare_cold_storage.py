@@ -0,0 +1,76 @@
+import pytest
+
+from scripts import prepare_cold_storage as pcs
+
+
+###############################################################################
+# prepare_cold_storage repository hash – BLAKE3 and SHA-256 tree digests      #
+###############################################################################
+
+# Pinned digests of the tree written by _populate: H over, in sorted walk order
+# (files before subdirectories), each relative path, a NUL and H(file contents)
+TREE_DIGESTS = {
+    "blake3": "97f04792f4ce45ab67d2dd1ad6cc71aa3a6f12123bff45e852e3364d0521e1be",
+    "sha256": "9da03d8c90fdf8ce1192dfa33e1d227a75e501c495aef52e393e386db7467610",
+}
+
+
+def _populate(root, order):
+    """Write the reference tree under *root*, creating files in *order*."""
+    files = {
+        "README.md": b"ARK\n",
+        "src/lib.rs": b"fn main() {}\n",
+        "src/nested/data.bin": bytes(range(256)) * 300,  # above MMAP_THRESHOLD
+        "empty.txt": b"",
+    }
+    for rel in order(sorted(files)):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(files[rel])
+
+
+@pytest.fixture(params=["blake3", "sha256"])
+def algorithm(request, monkeypatch):
+    if request.param == "blake3":
+        pytest.importorskip("blake3")
+    else:
+        monkeypatch.setattr(pcs, "blake3", None)
+    return request.param
+
+
+def test_repository_hash_is_pinned(algorithm, tmp_path):
+    _populate(tmp_path, list)
+    preparator = pcs.ARKColdStoragePreparator()
+
+    assert preparator.calculate_directory_hash(str(tmp_path)) == TREE_DIGESTS[algorithm]
+    assert preparator.total_uncompressed == 4 + 13 + 256 * 300
+
+
+def test_repository_hash_ignores_excluded_paths(algorithm, tmp_path):
+    _populate(tmp_path, list)
+    for rel in ("__pycache__/lib.cpython-311.pyc", "src/mod.pyc", "scratch.tmp",
+                ".git/objects/ab/cdef", "cold_storage_archive/old.tar.xz"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"excluded")
+
+    digest = pcs.ARKColdStoragePreparator().calculate_directory_hash(str(tmp_path))
+    assert digest == TREE_DIGESTS[algorithm]
+
+
+def test_repository_hash_ignores_creation_order(algorithm, tmp_path):
+    forward, backward = tmp_path / "forward", tmp_path / "backward"
+    _populate(forward, list)
+    _populate(backward, lambda names: list(reversed(names)))
+
+    preparator = pcs.ARKColdStoragePreparator()
+    assert (preparator.calculate_directory_hash(str(forward))
+            == preparator.calculate_directory_hash(str(backward)))
+
+
+def test_repository_hash_binds_paths(algorithm, tmp_path):
+    _populate(tmp_path, list)
+    (tmp_path / "src" / "lib.rs").rename(tmp_path / "src" / "main.rs")
+
+    digest = pcs.ARKColdStoragePreparator().calculate_directory_hash(str(tmp_path))
+    assert digest != TREE_DIGESTS[algorithm]